@@ -13,6 +13,7 @@ class BaseAgent:
         state_dim,
         action_dim,
         discrete_actions=True,
+        verbose=False,
     ):
         self.actor = actor
         self.critic = critic
@@ -20,6 +21,7 @@ class BaseAgent:
         self.state_dim = state_dim
         self.action_dim = action_dim
         self.discrete_actions = discrete_actions
+        self.verbose = verbose
 
     def prepare_state(self, state):
         if not isinstance(state, torch.Tensor):
@@ -29,22 +31,24 @@ class BaseAgent:
             state = state.unsqueeze(0)
         return state.float()
 
+    def actor_critic(self, state):
+        return self.actor(state), self.critic(state).squeeze(-1)
+
     def getAction(self, state, action=None, grad=False):
         state = self.prepare_state(state)
         if not grad:
             self.actor.eval()
             self.critic.eval()
             with torch.no_grad():
-                action_values = self.actor(state)
-                state_values = self.critic(state).squeeze(-1)
+                action_values, state_values = self.actor_critic(state)
             self.actor.train()
             self.critic.train()
         else:
-            action_values = self.actor(state)
-            state_values = self.critic(state).squeeze(-1)
+            action_values, state_values = self.actor_critic(state)
 
         if self.discrete_actions: 
-            print(action_values)
+            if self.verbose:
+                print(action_values)
             dist = Categorical(action_values)
         else:
             cov_mat = torch.diag(self.action_var).unsqueeze(dim=0)
@@ -99,5 +103,6 @@ class BaseAgent:
             device=self.device,
             state_dim=self.state_dim,
             action_dim=self.action_dim,
-            discrete_actions=self.discrete_actions
+            discrete_actions=self.discrete_actions,
+            verbose=self.verbose
         )
\ No newline at end of file
@@ -1,11 +1,18 @@
 from .llm_args import LLMArgs
 from .llm_agent import LLMAgent
-from .prompt_util import create_prompt
+from .prompt_util import create_prompt, escape_braces
 
 from transformers import AutoModelForCausalLM, AutoTokenizer
 import gymnasium as gym
 import torch
 
+# Keyed by the raw bytes in env.desc, so tiles are looked up without decoding
+TILE_DESCRIPTIONS = {
+    b'S': 'start',
+    b'F': 'floor',
+    b'H': 'hole',
+}
+
 # TODO: this should be a subclass of BaseEnv or maybe the FrozenLakeEnv class
 class FrozenLake:
     def __init__(self, is_slippery=False):
@@ -14,6 +21,9 @@ class FrozenLake:
         self.timestamp = 0
         self.done = False
 
+        # The map is fixed for the env's lifetime, so describe every state once
+        self._state_strs = [self._render_state_str(state) for state in range(self.env.desc.size)]
+
         self.env_description = ''.join([
             'I am OrcaPhi. The following is my internal dialogue as an intelligent AI agent.',
             'I am playing a video game where I must avoid walking into any holes while',
@@ -29,50 +39,50 @@ class FrozenLake:
             2: 'East',
             3: 'North'
         }
-        
 
-    def thought_prompt_factory(self, observation_stream, thought_stream):
-        system_prompt = create_prompt('system', '\n'.join([
-            self.env_description,
-            f'My observations: {observation_stream}',
-            f'My past thoughts: {thought_stream}',
-            f'Possible Actions: {self.action_space}'
-        ]))
-        return '\n'.join([
-            system_prompt,
+        # Everything except the streams is fixed per env, so build the prompts once as templates
+        env_description = escape_braces(self.env_description)
+        action_space = escape_braces(str(self.action_space))
+        self._thought_prompt_template = '\n'.join([
+            create_prompt('system', '\n'.join([
+                env_description,
+                'My observations: {observation_stream}',
+                'My past thoughts: {thought_stream}',
+                f'Possible Actions: {action_space}'
+            ])),
             create_prompt('user', 'Choose which action you will take.'),
             create_prompt('assistant', '', terminate=False)
         ])
-
-    def action_prompt_factory(self, thought_stream):
-        system_prompt = create_prompt('system', '\n'.join([
-            self.env_description,
-            f'My plans: {thought_stream}',
-            f'Possible Actions: {self.action_space}'
-        ]))
-        return '\n'.join([
-            system_prompt,
+        self._action_prompt_template = '\n'.join([
+            create_prompt('system', '\n'.join([
+                env_description,
+                'My plans: {thought_stream}',
+                f'Possible Actions: {action_space}'
+            ])),
             create_prompt('user', 'What action are you going to take?'),
             create_prompt('assistant', 'I will take action "', terminate=False)
         ])
 
+    def thought_prompt_factory(self, observation_stream, thought_stream):
+        return self._thought_prompt_template.format(
+            observation_stream=observation_stream,
+            thought_stream=thought_stream
+        )
+
+    def action_prompt_factory(self, thought_stream):
+        return self._action_prompt_template.format(thought_stream=thought_stream)
+
     def describe_tile(self, row, col):
-        if row < 0 or row >= 3 or col < 0 or col >= 3:
+        nrow, ncol = self.env.desc.shape
+        if row < 0 or row >= nrow or col < 0 or col >= ncol:
             return 'wall'
-        else:
-             env_letter = self.env.desc[row, col].decode('utf-8')
-             match env_letter:
-                 case 'S':
-                     return 'start'
-                 case 'F':
-                     return 'floor'
-                 case 'H':
-                     return 'hole'
-                 case _:
-                     return 'unknown'
+        return TILE_DESCRIPTIONS.get(self.env.desc[row, col], 'unknown')
 
     def state_to_str(self, state):
-        row, col = state // 4, state % 4
+        return self._state_strs[state]
+
+    def _render_state_str(self, state):
+        row, col = divmod(state, self.env.desc.shape[1])
         surroundings = [
             f"North: {self.describe_tile(row - 1, col)}",
             f"South: {self.describe_tile(row + 1, col)}",
@@ -101,10 +111,7 @@ class FrozenLake:
             )
             tokenizer.pad_token = tokenizer.eos_token
 
-            llm_args = LLMArgs.builder() \
-                .with_llm(llm) \
-                .with_tokenizer(tokenizer) \
-                .build()
+            llm_args = LLMArgs(llm=llm, tokenizer=tokenizer)
             agent = LLMAgent(llm_args, self.action_space)
 
         state, _ = self.reset()
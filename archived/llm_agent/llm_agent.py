@@ -1,3 +1,4 @@
+from collections import deque
 from torch import nn
 import torch
 
@@ -5,28 +6,38 @@ from .base_agent import BaseAgent
 
 class Stream:
     def __init__(self, max_len):
-        self.stream = []
+        self.stream = deque(maxlen=max_len)
         self.max_len = max_len
+        self._joined = ''
     
     def append(self, entry, timestamp):
         self.stream.append(f"<t={timestamp}> {entry} ")
-        self.stream = self.stream[-self.max_len:]
+        self._joined = None
 
+    # Rendered several times per step (prompts, tokenization), so join once per append
     def __str__(self):
-        return ''.join(self.stream)
+        if self._joined is None:
+            self._joined = ''.join(self.stream)
+        return self._joined
 
 class LLMHead(nn.Module):
     def __init__(self, llm, output_size, softmax_output=False):
         super().__init__()
         self.llm = llm
-        self.head = nn.Linear(llm.config.hidden_size, output_size).to(llm.device)
+        self.head = nn.Linear(llm.config.hidden_size, output_size).to(device=llm.device, dtype=llm.dtype)
         self.softmax_output = softmax_output
 
     def forward(self, input_ids, attention_mask=None):
-        # TODO: 1) need to enable returning hidden states. 2) need to index into llm_output.hidden_states, as last_hidden_state does not exist
-        llm_output = self.llm(input_ids=input_ids, attention_mask=attention_mask, return_dict=True, output_hidden_states=True)
-        last_hidden_state = llm_output.hidden_states[-1]
-        embedding = self.head(last_hidden_state[:, -1, :])
+        return self.from_hidden(self.last_token_hidden(input_ids, attention_mask))
+
+    def last_token_hidden(self, input_ids, attention_mask=None):
+        # Run the bare decoder: its last_hidden_state equals hidden_states[-1] of the causal LM,
+        # without keeping every layer's activations or projecting every position onto the vocab
+        llm_output = self.llm.base_model(input_ids=input_ids, attention_mask=attention_mask, return_dict=True)
+        return llm_output.last_hidden_state[:, -1, :]
+
+    def from_hidden(self, hidden):
+        embedding = self.head(hidden)
         if self.softmax_output:
             return torch.softmax(embedding, dim=-1)
         return embedding
@@ -42,9 +53,10 @@ class CriticNet(LLMHead):
 class LLMAgent(BaseAgent):
     def __init__(self, llm_args, action_space):
         self.llm = llm_args.llm
-        print(self.llm.config)
         self.tokenizer = llm_args.tokenizer
         self.verbose = llm_args.verbose
+        if self.verbose:
+            print(self.llm.config)
 
         self.action_stream = Stream(5)
         self.thought_stream = Stream(5)
@@ -57,11 +69,16 @@ class LLMAgent(BaseAgent):
         device = self.llm.device
         state_dim = (self.num_internal_state_tokens,)
         action_dim = len(action_space)
-        super().__init__(actor, critic, device, state_dim, action_dim, discrete_actions=True)
+        super().__init__(actor, critic, device, state_dim, action_dim, discrete_actions=True, verbose=self.verbose)
 
     def prepare_state(self, internal_state):
         return internal_state
 
+    # Actor and critic share the LLM backbone, so run it once and apply both heads
+    def actor_critic(self, state):
+        hidden = self.actor.last_token_hidden(state)
+        return self.actor.from_hidden(hidden), self.critic.from_hidden(hidden).squeeze(-1)
+
     # Updates the agent's thought and observation streams and returns its internal state 
     def update(self, state, reward, timestamp, thought_prompt_factory, state_to_str):
         self._update_observation_stream(state, reward, timestamp, state_to_str)
@@ -86,7 +103,8 @@ class LLMAgent(BaseAgent):
         # TODO: need to create streaming wrapper around llm, so that generation can stop on the <|im_end|> string
         output = self.llm.generate(input_ids, temperature=0.5, repetition_penalty=1.25, do_sample=True, max_new_tokens=50)
         thought = self.tokenizer.decode(output[0][input_ids.shape[-1]:])
-        print(thought)
+        if self.verbose:
+            print(thought)
         self.thought_stream.append(thought, timestamp)
 
     # Limited to most recent observation for now
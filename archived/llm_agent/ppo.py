@@ -1,4 +1,5 @@
 import copy
+import itertools
 import numpy as np
 import torch
 import torch.optim as optim
@@ -6,6 +7,25 @@ from torch.distributions import Categorical, MultivariateNormal
 
 from .base_agent import BaseAgent
 
+# Deltas are computed in one vectorized pass; only the reverse scan stays a loop, and
+# it runs over NumPy rows rather than dispatching several torch ops per step
+def compute_gae(rewards, values, dones, next_value, gamma, gae_lambda):
+    values = np.asarray(values, dtype=np.float64)
+    rewards = np.asarray(rewards, dtype=np.float64).reshape(values.shape)
+    dones = np.asarray(dones, dtype=np.float64).reshape(values.shape)
+    next_value = np.asarray(next_value, dtype=np.float64).reshape((1,) + values.shape[1:])
+
+    nextnonterminal = 1.0 - np.concatenate([dones[1:], dones[-1:]])
+    nextvalues = np.concatenate([values[1:], next_value])
+    deltas = rewards + gamma * nextvalues * nextnonterminal - values
+
+    advantages = np.empty_like(deltas)
+    last_gae_lambda = 0.0
+    for t in reversed(range(len(deltas))):
+        last_gae_lambda = deltas[t] + gamma * gae_lambda * nextnonterminal[t] * last_gae_lambda
+        advantages[t] = last_gae_lambda
+    return advantages
+
 class PPO:
     def __init__(
         self,
@@ -43,10 +63,11 @@ class PPO:
         self.fitness = []
         self.steps = [0]
 
-        # Create the optimizer
-        actor_params = set(agent.actor.parameters())
-        critic_params = set(agent.critic.parameters())
-        combined_params = actor_params.union(critic_params)
+        # Create the optimizer. Actor and critic share the LLM backbone, so dedupe its
+        # parameters while keeping registration order
+        combined_params = dict.fromkeys(
+            itertools.chain(agent.actor.parameters(), agent.critic.parameters())
+        )
         self.optimizer = optim.Adam([
             {"params": list(combined_params), "lr": self.lr}
         ])
@@ -56,13 +77,17 @@ class PPO:
         return self.agent.getAction(state, action, grad)
 
     def learn(self, experiences, noise_clip=0.5, policy_noise=0.2):
-        print([arr for arr in experiences])
+        # Printing the rollout reprs every tensor in it, forcing a device sync, so only when asked
+        if self.agent.verbose:
+            print([arr for arr in experiences])
         #experiences = [torch.from_numpy(np.array(exp.cpu())) for exp in experiences]
         states, actions, log_probs, rewards, dones, values, next_state = experiences
         # TODO: clean up
-        print(f'# states: {len(states)}, state shape: {states[0].shape}')
+        if self.agent.verbose:
+            print(f'# states: {len(states)}, state shape: {states[0].shape}')
         states = torch.stack([state.squeeze() for state in states])
-        print(f'stacked states shape: {states.shape}')
+        if self.agent.verbose:
+            print(f'stacked states shape: {states.shape}')
         actions = torch.from_numpy(np.array(actions))
         log_probs = torch.from_numpy(np.array(log_probs))
         rewards = torch.from_numpy(np.array(rewards))
@@ -71,25 +96,11 @@ class PPO:
 
         # Bootstrapping
         with torch.no_grad():
-            num_steps = rewards.size(0)
             next_state = self.agent.prepare_state(next_state)
             next_value = self.agent.critic(next_state).reshape(1, -1).cpu()
-            advantages = torch.zeros_like(rewards)
-            last_gae_lambda = 0
-            for t in reversed(range(num_steps)):
-                if t == num_steps - 1:
-                    nextnonterminal = 1.0 - dones[-1]
-                    nextvalues = next_value
-                else:
-                    nextnonterminal = 1.0 - dones[t + 1]
-                    nextvalues = values[t + 1]
-                delta = (
-                    rewards[t] + self.gamma * nextvalues * nextnonterminal - values[t]
-                )
-                advantages[t] = last_gae_lambda = (
-                    delta
-                    + self.gamma * self.gae_lambda * nextnonterminal * last_gae_lambda
-                )
+            advantages = torch.from_numpy(compute_gae(
+                rewards, values, dones, next_value, self.gamma, self.gae_lambda
+            ))
             returns = advantages + values
 
         states = states.reshape((-1,) + self.agent.state_dim)
@@ -113,12 +124,12 @@ class PPO:
         )
 
         num_samples = returns.size(0)
-        batch_idxs = np.arange(num_samples)
 
         clipfracs = []
 
         for epoch in range(self.update_epochs):
-            np.random.shuffle(batch_idxs)
+            # Shuffle on the device so minibatch indices need no host-to-device copy
+            batch_idxs = torch.randperm(num_samples, device=device)
             for start in range(0, num_samples, self.batch_size):
                 minibatch_idxs = batch_idxs[start : start + self.batch_size]
 
@@ -163,7 +174,7 @@ class PPO:
                 loss = pg_loss - self.ent_coef * entropy_loss + v_loss * self.vf_coef
 
                 # actor loss backprop
-                self.optimizer.zero_grad()
+                self.optimizer.zero_grad(set_to_none=True)
                 loss.backward()
                 self.optimizer.step()
 
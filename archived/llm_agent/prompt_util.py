@@ -6,4 +6,8 @@ def create_prompt(role, content, terminate=True):
     return '\n'.join([
         PROMPT_PREFIX + role,
         content + suffix
-    ])
\ No newline at end of file
+    ])
+
+# Escapes literal text for use inside a str.format template
+def escape_braces(text):
+    return text.replace('{', '{{').replace('}', '}}')
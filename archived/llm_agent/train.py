@@ -174,10 +174,7 @@ def main():
         #    torch_dtype=torch.bfloat16
         #)
 
-        llm_args = LLMArgs.builder() \
-            .with_llm(llm) \
-            .with_tokenizer(tokenizer) \
-            .build()
+        llm_args = LLMArgs(llm=llm, tokenizer=tokenizer)
         agent = LLMAgent(llm_args, env.action_space)
 
         agent_pop.append(
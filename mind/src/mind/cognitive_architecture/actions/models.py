@@ -189,6 +189,9 @@ class Action(BaseModel):
 class AvailableAction(BaseModel):
     """An action that can be taken"""
 
+    # Frozen so the fixed general actions can be shared across ticks and minds
+    model_config = {"frozen": True}
+
     name: str = Field(description="Action identifier like 'move_to'")
     description: str = Field(description="Human-readable description of what this action does")
     parameters: dict[str, str] = Field(
@@ -1,6 +1,6 @@
 """Memory subsystem for the cognitive architecture"""
 
 from .models import Memory
-from .vector_db_memory import VectorDBMemory
+from .vector_db_memory import MemoryRecord, VectorDBMemory
 
-__all__ = ["Memory", "VectorDBMemory"]
+__all__ = ["Memory", "MemoryRecord", "VectorDBMemory"]
@@ -1,6 +1,8 @@
 """Simple memory store using ChromaDB for vector storage"""
 
 import os
+from collections import OrderedDict
+from typing import NotRequired, TypedDict
 
 import chromadb
 from chromadb.errors import NotFoundError
@@ -12,6 +14,9 @@ from mind.constants import DEFAULT_EMBEDDING_MODEL
 from ..id_generator import IdGenerator
 from .models import Memory
 
+# Query embeddings kept per store; NPCs re-issue the same memory queries across ticks
+DEFAULT_QUERY_CACHE_SIZE = 256
+
 
 def _delete_collection_if_exists(client: chromadb.ClientAPI, collection_name: str) -> None:
     """Delete a collection, treating "already gone" as success.
@@ -30,6 +35,16 @@ def _delete_collection_if_exists(client: chromadb.ClientAPI, collection_name: st
         pass
 
 
+class MemoryRecord(TypedDict):
+    """One memory to add through add_memories; mirrors add_memory's arguments"""
+
+    content: str
+    importance: NotRequired[float]
+    timestamp: NotRequired[int | None]
+    location: NotRequired[tuple[int, int] | None]
+    tags: NotRequired[list[str] | None]
+
+
 class VectorDBMetadata(BaseModel):
     """Metadata stored with each memory in ChromaDB"""
 
@@ -108,6 +123,17 @@ class ChromaQueryResult(BaseModel):
             self.first_query_distances,
         )
 
+    def iter_query(self, index: int):
+        """Iterate over (id, document, metadata, distance) tuples for the index-th query"""
+        ids = self.ids[index]
+        distances = self.distances[index] if self.distances and self.distances[index] else None
+        return zip(
+            ids,
+            self.documents[index],
+            self.metadatas[index],
+            distances if distances is not None else [None] * len(ids),
+        )
+
 
 class VectorDBMemory:
     """Vector-based memory storage using ChromaDB - a configurable component for memory systems
@@ -122,6 +148,7 @@ class VectorDBMemory:
         collection_name: str = "memories",
         embedding_model: str = DEFAULT_EMBEDDING_MODEL,
         storage_path: str | None = None,
+        query_cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
     ):
         """Initialize vector database memory component
 
@@ -129,9 +156,12 @@ class VectorDBMemory:
             collection_name: Name of the ChromaDB collection
             embedding_model: SentenceTransformer model name for embeddings
             storage_path: Directory path for persistent storage (None = in-memory only)
+            query_cache_size: Query embeddings kept in the LRU cache (0 disables it)
         """
         # Initialize embedding model
         self.encoder = SentenceTransformer(embedding_model)
+        self.query_cache_size = query_cache_size
+        self._query_embeddings: OrderedDict[str, list[float]] = OrderedDict()
 
         # Initialize ChromaDB with telemetry disabled
         settings = chromadb.Settings(anonymized_telemetry=False, allow_reset=True)
@@ -221,83 +251,145 @@ class VectorDBMemory:
             location: Grid coordinates (x, y)
             tags: Categorical tags for filtering
         """
-        tag_list = tags or []
-
-        # Generate memory ID
-        memory_id = IdGenerator.generate_memory_id()
-
-        # Create memory object
-        memory = Memory(
-            id=memory_id,
-            content=content,
-            timestamp=timestamp,
-            importance=importance,
-            location=location,
-            tags=tag_list,
-        )
+        return self.add_memories(
+            [
+                {
+                    "content": content,
+                    "importance": importance,
+                    "timestamp": timestamp,
+                    "location": location,
+                    "tags": tags,
+                }
+            ]
+        )[0]
+
+    def add_memories(self, records: list[MemoryRecord]) -> list[Memory]:
+        """Add several memories with one batched embedding pass and one insert
 
-        # Generate embedding
-        embedding = self.encoder.encode(content, show_progress_bar=False).tolist()
-        memory.embedding = embedding
+        Args:
+            records: One record per memory (only "content" is required)
+        """
+        if not records:
+            return []
 
-        metadata = VectorDBMetadata(
-            importance=importance,
-            timestamp=timestamp,
-            location_x=location[0] if location else None,
-            location_y=location[1] if location else None,
-            tags=tag_list,
-        )
+        contents = [record["content"] for record in records]
+        embeddings = self.encoder.encode(contents, show_progress_bar=False).tolist()
 
-        # Store in ChromaDB (empty arrays not allowed in metadata, so exclude them)
-        metadata_dict = metadata.model_dump(exclude_none=True)
-        if not metadata_dict.get("tags"):
-            metadata_dict.pop("tags", None)
+        memories = []
+        metadata_dicts = []
+        for record, embedding in zip(records, embeddings, strict=True):
+            importance = record.get("importance", 1.0)
+            timestamp = record.get("timestamp")
+            location = record.get("location")
+            tag_list = record.get("tags") or []
+
+            memories.append(
+                Memory(
+                    id=IdGenerator.generate_memory_id(),
+                    content=record["content"],
+                    timestamp=timestamp,
+                    importance=importance,
+                    location=location,
+                    tags=tag_list,
+                    embedding=embedding,
+                )
+            )
+
+            metadata = VectorDBMetadata(
+                importance=importance,
+                timestamp=timestamp,
+                location_x=location[0] if location else None,
+                location_y=location[1] if location else None,
+                tags=tag_list,
+            )
+
+            # Empty arrays not allowed in ChromaDB metadata, so exclude them
+            metadata_dict = metadata.model_dump(exclude_none=True)
+            if not metadata_dict.get("tags"):
+                metadata_dict.pop("tags", None)
+            metadata_dicts.append(metadata_dict)
 
         self.collection.add(
-            ids=[memory_id],
-            embeddings=[embedding],
-            documents=[content],
-            metadatas=[metadata_dict],
+            ids=[memory.id for memory in memories],
+            embeddings=embeddings,
+            documents=contents,
+            metadatas=metadata_dicts,
         )
 
-        return memory
+        return memories
 
     async def search(self, query: VectorDBQuery) -> list[Memory]:
         """Search for memories using semantic similarity"""
+        return (await self.batch_search([query]))[0]
 
-        # Generate query embedding
-        query_embedding = self.encoder.encode(query.query, show_progress_bar=False).tolist()
+    async def batch_search(self, queries: list[VectorDBQuery]) -> list[list[Memory]]:
+        """Run several searches with one embedding pass, returning results per query
+
+        Queries that share a tag filter and top_k go to ChromaDB as a single
+        multi-embedding query.
+        """
+        if not queries:
+            return []
 
-        # Search in ChromaDB
         collection_count = self.collection.count()
         if collection_count == 0:
-            return []
+            return [[] for _ in queries]
+
+        query_embeddings = self._embed_queries([query.query for query in queries])
+
+        # ChromaDB applies one filter and n_results per call, so group compatible queries
+        groups: dict[tuple[tuple[str, ...], int], list[int]] = {}
+        for i, query in enumerate(queries):
+            groups.setdefault((tuple(query.tags or ()), query.top_k), []).append(i)
+
+        results: list[list[Memory]] = [[] for _ in queries]
+        for (tags, top_k), indices in groups.items():
+            raw_results = self.collection.query(
+                query_embeddings=[query_embeddings[i] for i in indices],
+                n_results=min(top_k, collection_count),
+                where=self._tag_filter(tags),
+                include=["documents", "metadatas", "distances"],
+            )
 
-        # Build tag filter using ChromaDB's native $contains operator
-        where_clause = None
-        if query.tags:
-            if len(query.tags) == 1:
-                where_clause = {"tags": {"$contains": query.tags[0]}}
-            else:
-                where_clause = {"$or": [{"tags": {"$contains": t}} for t in query.tags]}
+            # Parse into typed model
+            chroma_results = ChromaQueryResult(**raw_results)
+            for row, i in enumerate(indices):
+                results[i] = self._rank(queries[i], chroma_results.iter_query(row))
 
-        raw_results = self.collection.query(
-            query_embeddings=[query_embedding],
-            n_results=min(query.top_k, collection_count),
-            where=where_clause,
-            include=["documents", "metadatas", "distances"],
-        )
+        return results
 
-        # Parse into typed model
-        results = ChromaQueryResult(**raw_results)
+    def _embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """Embed query texts, encoding only those missing from the LRU cache in one batch"""
+        cache = self._query_embeddings
+        misses = list(dict.fromkeys(text for text in texts if text not in cache))
+        if misses:
+            encoded = self.encoder.encode(misses, show_progress_bar=False).tolist()
+            cache.update(zip(misses, encoded, strict=True))
 
-        if not results.first_query_ids:
-            return []
+        embeddings = []
+        for text in texts:
+            cache.move_to_end(text)
+            embeddings.append(cache[text])
+
+        while len(cache) > self.query_cache_size:
+            cache.popitem(last=False)
+        return embeddings
 
-        # Convert results to Memory objects with combined scoring
+    @staticmethod
+    def _tag_filter(tags: tuple[str, ...]) -> dict | None:
+        """Build a tag filter using ChromaDB's native $contains operator"""
+        if not tags:
+            return None
+        if len(tags) == 1:
+            return {"tags": {"$contains": tags[0]}}
+        return {"$or": [{"tags": {"$contains": t}} for t in tags]}
+
+    @staticmethod
+    def _rank(query: VectorDBQuery, rows) -> list[Memory]:
+        """Convert one query's result rows to Memory objects ordered by combined score"""
         memories = []
 
-        for memory_id, content, metadata_dict, distance in results.iter_first_query():
+        for memory_id, content, metadata_dict, distance in rows:
             # Parse metadata with type safety
             metadata = VectorDBMetadata.model_validate(metadata_dict)
 
@@ -1,5 +1,6 @@
 """Action selection node implementation"""
 
+import asyncio
 import json
 from pathlib import Path
 from pprint import pformat
@@ -16,6 +17,7 @@ from mind.cognitive_architecture.nodes.formatting import (
 from mind.cognitive_architecture.nodes.formatting import (
     format_personality,
 )
+from mind.cognitive_architecture.nodes.response_cache import ResponseCacheProtocol
 from mind.cognitive_architecture.observations import MindEvent, MindEventType
 from mind.cognitive_architecture.state import PipelineState
 from mind.knowledge import KnowledgeBase, KnowledgeFile
@@ -31,12 +33,26 @@ class ActionSelectionNode(LLMNode):
 
     step_name = "action_selection"
 
-    def __init__(self, llm: BaseChatModel):
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        response_cache: ResponseCacheProtocol | None = None,
+        structured_output: bool = False,
+        concurrency_limit: asyncio.Semaphore | None = None,
+    ):
         # Load prompt template
         prompt_path = Path(__file__).parent / "prompt.md"
         prompt = PromptTemplate.from_template(prompt_path.read_text())
 
-        super().__init__(llm, prompt, output_model=ActionSelectionOutput, max_retries=2)
+        super().__init__(
+            llm,
+            prompt,
+            output_model=ActionSelectionOutput,
+            max_retries=2,
+            response_cache=response_cache,
+            structured_output=structured_output,
+            concurrency_limit=concurrency_limit,
+        )
 
     async def process(self, state: PipelineState) -> PipelineState:
         """Select an action based on current cognitive and emotional state"""
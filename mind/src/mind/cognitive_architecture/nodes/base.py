@@ -1,5 +1,7 @@
 """Base utilities for pipeline nodes"""
 
+import asyncio
+import hashlib
 import json
 import time
 from abc import ABC
@@ -11,11 +13,21 @@ from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import PromptTemplate
 from pydantic import BaseModel, ValidationError
 
+from mind.cognitive_architecture.nodes.response_cache import ResponseCacheProtocol
 from mind.cognitive_architecture.state import PipelineState
 from mind.logging_config import get_logger
 
 logger = get_logger()
 
+# Rough characters-per-token ratio for English text with BPE tokenizers, used to
+# estimate usage when the provider does not report it
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text without a tokenizer"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
 
 def entity_tag(state: PipelineState) -> str:
     """Bracketed entity id for per-NPC log attribution.
@@ -42,9 +54,9 @@ class Node(ABC):
         original_process = cls.process
 
         async def timed_process(self, state: PipelineState) -> PipelineState:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             state = await original_process(self, state)
-            state.time_ms[self.step_name] = int((time.time() - start_time) * 1000)
+            state.record(self.step_name, ns=time.perf_counter_ns() - start_ns)
             return state
 
         cls.process = timed_process
@@ -59,6 +71,9 @@ class LLMNode(Node):
     - Structured (Pydantic) or raw (str) output
     - Prompt template validation via LangChain PromptTemplate
     - Validation context is always {"state": state}
+    - Optional response cache over rendered prompts
+    - Optional provider-native structured output (JSON schema mode)
+    - Optional shared cap on concurrent LLM requests
     """
 
     step_name: str = "llm_node"
@@ -69,6 +84,9 @@ class LLMNode(Node):
         prompt: PromptTemplate,
         output_model: type[BaseModel] | None = None,
         max_retries: int = 0,
+        response_cache: ResponseCacheProtocol | None = None,
+        structured_output: bool = False,
+        concurrency_limit: asyncio.Semaphore | None = None,
     ):
         """
         Args:
@@ -76,6 +94,18 @@ class LLMNode(Node):
             prompt: LangChain PromptTemplate with variable validation
             output_model: Pydantic model for structured output, None for raw string
             max_retries: Number of retry attempts on validation failure (default 0)
+            response_cache: Cache of responses by rendered prompt.
+                Only pass one for deterministic (temperature 0) LLMs, otherwise
+                sampling is frozen.
+            structured_output: Request output_model's JSON schema from the provider
+                (with_structured_output, json_schema method) so well-formed JSON comes
+                back on the first attempt. Only enable for providers that support it.
+                Off unless a mind opts in via MindConfig.llm_structured_output: a
+                provider that rejects response_format fails the request itself, which
+                retries and json_repair cannot recover from.
+            concurrency_limit: Semaphore bounding in-flight LLM requests. Share one
+                across nodes and minds to cap load on a single provider while many
+                NPC pipelines run concurrently.
 
         Raises:
             ValueError: If max_retries > 0 but output_model is None
@@ -89,18 +119,63 @@ class LLMNode(Node):
         self.prompt = prompt
         self.output_model = output_model
         self.max_retries = max_retries
-        self.parser = None
-
-        # Set up parser if structured output
-        if output_model is not None:
-            self.parser = PydanticOutputParser(pydantic_object=output_model)
+        self.response_cache = response_cache
+        self.concurrency_limit = concurrency_limit
+        self._format_instructions = self._build_format_instructions(output_model)
+        self._prompt_fingerprint = self._build_prompt_fingerprint(prompt, output_model)
+
+        # The schema dict (not the model class) is passed so the provider returns a
+        # plain dict; validation still happens here, with the {"state": state} context.
+        self._structured_llm = None
+        if structured_output and output_model is not None:
+            self._structured_llm = llm.with_structured_output(
+                output_model.model_json_schema(), method="json_schema", include_raw=True
+            )
 
     def get_format_instructions(self) -> str:
         """Get format instructions with optional enhancement for JSON-only output"""
-        if not self.parser:
+        return self._format_instructions
+
+    @staticmethod
+    def _build_prompt_fingerprint(
+        prompt: PromptTemplate, output_model: type[BaseModel] | None
+    ) -> str:
+        """Short hash of the prompt template and output schema, computed once.
+
+        Scoping cache entries by it means editing either one invalidates stale
+        responses instead of serving them.
+        """
+        digest = hashlib.sha256(prompt.template.encode())
+        if output_model is not None:
+            schema = json.dumps(output_model.model_json_schema(), sort_keys=True)
+            digest.update(schema.encode())
+        return digest.hexdigest()[:16]
+
+    @property
+    def cache_namespace(self) -> str:
+        """Response cache namespace: step name, model and prompt fingerprint.
+
+        The model is part of it because one cache is shared across minds, and minds
+        can be configured with different models.
+        """
+        model = getattr(self.llm, "model_name", None) or getattr(self.llm, "model", "")
+        return f"{self.step_name}:{model}:{self._prompt_fingerprint}"
+
+    @staticmethod
+    def _build_format_instructions(output_model: type[BaseModel] | None) -> str:
+        """Render format instructions once per node.
+
+        Rendering walks the output model's JSON schema (~2ms for
+        CognitiveUpdateOutput) and the result never changes for a node, so it is
+        built at construction instead of on every call.
+        """
+        if output_model is None:
             return ""
 
-        base_instructions = self.parser.get_format_instructions()
+        # The parser is only used to render the schema; output is validated directly
+        base_instructions = PydanticOutputParser(
+            pydantic_object=output_model
+        ).get_format_instructions()
 
         # Add explicit instruction to output raw JSON without markdown fences
         return (
@@ -121,17 +196,24 @@ class LLMNode(Node):
         # Format prompt using template (validates required vars)
         prompt_text = self.prompt.format(**prompt_vars)
 
+        if self.response_cache is not None:
+            cached = await self._cached_output(prompt_text, state)
+            if cached is not None:
+                return cached
+
         # Raw string output (no retry needed)
         if self.output_model is None:
-            start_time = time.time()
-            response = await self.llm.ainvoke([HumanMessage(content=prompt_text)])
-            elapsed_ms = int((time.time() - start_time) * 1000)
-            tokens = self._extract_tokens(response)
-            if tokens:
-                state.tokens_used[self.step_name] = tokens
+            start_ns = time.perf_counter_ns()
+            messages = [HumanMessage(content=prompt_text)]
+            response = await self._ainvoke(self.llm, messages)
+            elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            tokens = self._extract_tokens(response, messages)
+            state.record(self.step_name, tokens=tokens)
             logger.debug(
                 f"{entity_tag(state)} [{self.step_name}] Completed in {elapsed_ms}ms, {tokens} tokens"
             )
+            if self.response_cache is not None:
+                await self.response_cache.set(self.cache_namespace, prompt_text, response.content)
             return response.content
 
         # Structured output with retry
@@ -139,31 +221,32 @@ class LLMNode(Node):
         last_error = None
         max_attempts = self.max_retries + 1
         total_tokens = 0
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         for attempt in range(max_attempts):
             try:
                 # Call LLM
-                response = await self.llm.ainvoke(messages)
+                response, parsed = await self._invoke_structured(messages)
 
                 # Track tokens from this attempt
-                total_tokens += self._extract_tokens(response)
+                total_tokens += self._extract_tokens(response, messages)
 
-                # Parse JSON (json_repair handles common formatting issues)
-                data = json_repair_loads(response.content)
-
-                # Validate with state context
-                validated = self.parser.pydantic_object.model_validate(
-                    data, context={"state": state}
-                )
+                # Parse and validate with state context
+                if parsed is not None:
+                    validated = self.output_model.model_validate(parsed, context={"state": state})
+                else:
+                    validated = self._validate_output(response.content, state)
 
                 # Success! Track total tokens and return
-                elapsed_ms = int((time.time() - start_time) * 1000)
-                if total_tokens:
-                    state.tokens_used[self.step_name] = total_tokens
+                elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                state.record(self.step_name, tokens=total_tokens)
                 logger.debug(
                     f"{entity_tag(state)} [{self.step_name}] Completed in {elapsed_ms}ms, {total_tokens} tokens"
                 )
+                if self.response_cache is not None:
+                    await self.response_cache.set(
+                        self.cache_namespace, prompt_text, response.content
+                    )
                 return validated
 
             except (json.JSONDecodeError, ValidationError) as e:
@@ -195,12 +278,76 @@ class LLMNode(Node):
                     messages.append(HumanMessage(content=error_msg))
 
         # All retries exhausted - still track tokens
-        if total_tokens:
-            state.tokens_used[self.step_name] = total_tokens
+        state.record(self.step_name, tokens=total_tokens)
         raise last_error
 
-    def _extract_tokens(self, response: AIMessage) -> int:
-        """Extract token count from response.usage_metadata"""
+    async def _invoke_structured(self, messages: list) -> tuple[AIMessage, dict | None]:
+        """Call the LLM, also returning provider-parsed JSON in structured-output mode.
+
+        The parsed dict is None when structured output is off or the provider could
+        not parse its own output; callers then fall back to parsing the raw content.
+        """
+        if self._structured_llm is None:
+            return await self._ainvoke(self.llm, messages), None
+        result = await self._ainvoke(self._structured_llm, messages)
+        return result["raw"], result["parsed"]
+
+    async def _ainvoke(self, runnable, messages: list):
+        """Invoke an LLM runnable, holding the concurrency limit if one is set"""
+        if self.concurrency_limit is None:
+            return await runnable.ainvoke(messages)
+        async with self.concurrency_limit:
+            return await runnable.ainvoke(messages)
+
+    async def _cached_output(
+        self, prompt_text: str, state: PipelineState
+    ) -> BaseModel | str | None:
+        """Cached output for this prompt, or None on a miss.
+
+        Structured hits are re-validated against the current state, since validity
+        (e.g. of an Action) can depend on more than the rendered prompt. A hit that
+        no longer validates is treated as a miss.
+        """
+        content = await self.response_cache.get(self.cache_namespace, prompt_text)
+        if content is None:
+            return None
+        if self.output_model is None:
+            logger.debug(f"{entity_tag(state)} [{self.step_name}] Response cache hit")
+            return content
+        try:
+            validated = self._validate_output(content, state)
+        except ValidationError:
+            return None
+        logger.debug(f"{entity_tag(state)} [{self.step_name}] Response cache hit")
+        return validated
+
+    def _validate_output(self, content: str, state: PipelineState) -> BaseModel:
+        """Parse and validate structured output, repairing the JSON only when needed.
+
+        model_validate_json parses and validates in a single pydantic-core pass
+        without materializing an intermediate dict. Only output that is not valid
+        JSON at all (markdown fences, trailing commas, truncation) goes through the
+        much slower pure-Python json_repair; schema errors are raised as-is so the
+        retry loop can report them.
+        """
+        output_model = self.output_model
+        context = {"state": state}
+        try:
+            return output_model.model_validate_json(content, context=context)
+        except ValidationError as e:
+            if not any(error["type"] == "json_invalid" for error in e.errors()):
+                raise
+
+        # json_repair handles common formatting issues
+        return output_model.model_validate(json_repair_loads(content), context=context)
+
+    def _extract_tokens(self, response: AIMessage, messages: list | None = None) -> int:
+        """Extract token count from response.usage_metadata.
+
+        Providers that report no usage get an estimate from the prompt messages and
+        response text, so cost is still tracked.
+        """
         if hasattr(response, "usage_metadata") and response.usage_metadata:
             return response.usage_metadata.get("total_tokens", 0)
-        return 0
+        texts = [message.content for message in messages or []] + [response.content]
+        return sum(estimate_tokens(text) for text in texts if isinstance(text, str))
@@ -1,5 +1,6 @@
 """Cognitive update node implementation"""
 
+import asyncio
 from pathlib import Path
 from pprint import pformat
 
@@ -13,6 +14,7 @@ from mind.cognitive_architecture.nodes.formatting import (
 from mind.cognitive_architecture.nodes.formatting import (
     format_personality,
 )
+from mind.cognitive_architecture.nodes.response_cache import ResponseCacheProtocol
 from mind.cognitive_architecture.state import PipelineState
 from mind.knowledge import KnowledgeBase, KnowledgeFile
 from mind.logging_config import get_logger
@@ -27,12 +29,26 @@ class CognitiveUpdateNode(LLMNode):
 
     step_name = "cognitive_update"
 
-    def __init__(self, llm: BaseChatModel):
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        response_cache: ResponseCacheProtocol | None = None,
+        structured_output: bool = False,
+        concurrency_limit: asyncio.Semaphore | None = None,
+    ):
         # Load prompt template
         prompt_path = Path(__file__).parent / "prompt.md"
         prompt = PromptTemplate.from_template(prompt_path.read_text())
 
-        super().__init__(llm, prompt, output_model=CognitiveUpdateOutput, max_retries=2)
+        super().__init__(
+            llm,
+            prompt,
+            output_model=CognitiveUpdateOutput,
+            max_retries=2,
+            response_cache=response_cache,
+            structured_output=structured_output,
+            concurrency_limit=concurrency_limit,
+        )
 
     async def process(self, state: PipelineState) -> PipelineState:
         """Update cognitive context with retrieved memories and observations"""
@@ -25,18 +25,23 @@ class MemoryConsolidationNode(Node):
     async def process(self, state: PipelineState) -> PipelineState:
         """Consolidate daily memories into long-term storage"""
 
-        # Add all daily memories to long-term storage
-        for new_memory in state.daily_memories:
-            # Extract location from status observation if available
-            location = None
-            if state.observation.status:
-                location = state.observation.status.position
-
-            self.memory_store.add_memory(
-                content=new_memory.content,
-                importance=new_memory.importance,
-                timestamp=state.observation.current_simulation_time,
-                location=location,
+        # Extract location from status observation if available
+        location = None
+        if state.observation.status:
+            location = state.observation.status.position
+
+        # Add all daily memories to long-term storage in one batch
+        if state.daily_memories:
+            self.memory_store.add_memories(
+                [
+                    {
+                        "content": new_memory.content,
+                        "importance": new_memory.importance,
+                        "timestamp": state.observation.current_simulation_time,
+                        "location": location,
+                    }
+                    for new_memory in state.daily_memories
+                ]
             )
 
         # Clear daily buffer
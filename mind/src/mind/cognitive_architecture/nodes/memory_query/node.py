@@ -1,11 +1,13 @@
 """Memory query generation node"""
 
+import asyncio
 from pathlib import Path
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.prompts import PromptTemplate
 
 from mind.cognitive_architecture.nodes.base import LLMNode, entity_tag
+from mind.cognitive_architecture.nodes.response_cache import ResponseCacheProtocol
 from mind.cognitive_architecture.state import PipelineState
 from mind.logging_config import get_logger
 
@@ -19,12 +21,26 @@ class MemoryQueryNode(LLMNode):
 
     step_name = "memory_query"
 
-    def __init__(self, llm: BaseChatModel):
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        response_cache: ResponseCacheProtocol | None = None,
+        structured_output: bool = False,
+        concurrency_limit: asyncio.Semaphore | None = None,
+    ):
         # Load prompt template
         prompt_path = Path(__file__).parent / "prompt.md"
         prompt = PromptTemplate.from_template(prompt_path.read_text())
 
-        super().__init__(llm, prompt, output_model=MemoryQueryOutput, max_retries=2)
+        super().__init__(
+            llm,
+            prompt,
+            output_model=MemoryQueryOutput,
+            max_retries=2,
+            response_cache=response_cache,
+            structured_output=structured_output,
+            concurrency_limit=concurrency_limit,
+        )
 
     async def process(self, state: PipelineState) -> PipelineState:
         """Generate memory queries from observation"""
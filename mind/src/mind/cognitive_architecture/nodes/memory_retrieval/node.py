@@ -18,8 +18,8 @@ DEFAULT_MEMORIES_PER_QUERY = 2
 class MemoryStoreProtocol(Protocol):
     """Protocol for memory storage backends"""
 
-    async def search(self, query: VectorDBQuery) -> list[Memory]:
-        """Search for memories"""
+    async def batch_search(self, queries: list[VectorDBQuery]) -> list[list[Memory]]:
+        """Search for memories, returning one result list per query"""
         ...
 
 
@@ -39,24 +39,23 @@ class MemoryRetrievalNode(Node):
     async def process(self, state: PipelineState) -> PipelineState:
         """Retrieve memories using the queries in state"""
 
-        # Retrieve memories for each query
-        all_memories = []
-        for query_text in state.memory_queries:
-            query = VectorDBQuery(
+        # Retrieve memories for all queries with a single embedding pass
+        queries = [
+            VectorDBQuery(
                 query=query_text,
                 top_k=self.memories_per_query,
                 current_simulation_time=state.observation.current_simulation_time,
             )
-            results = await self.memory_store.search(query)
-            all_memories.extend(results)
-
-        # Deduplicate by memory ID, keeping first occurrence
-        seen_ids = set()
-        deduplicated_memories = []
-        for memory in all_memories:
-            if memory.id not in seen_ids:
-                seen_ids.add(memory.id)
-                deduplicated_memories.append(memory)
+            for query_text in state.memory_queries
+        ]
+
+        # Deduplicate by memory ID, keeping the first occurrence in query order
+        merged: dict[str, Memory] = {}
+        if queries:
+            for results in await self.memory_store.batch_search(queries):
+                for memory in results:
+                    merged.setdefault(memory.id, memory)
+        deduplicated_memories = list(merged.values())
 
         # Update state
         state.retrieved_memories = deduplicated_memories
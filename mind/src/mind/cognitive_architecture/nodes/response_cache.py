@@ -0,0 +1,59 @@
+"""Response caching for LLM nodes"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Protocol
+
+# Default number of responses kept per cache
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class ResponseCacheProtocol(Protocol):
+    """Protocol for LLM response cache backends
+
+    Entries are scoped by namespace (the node's step name plus a fingerprint of its
+    prompt template and output schema) so different nodes never share responses,
+    and editing a prompt or schema never serves stale ones.
+    """
+
+    async def get(self, namespace: str, prompt_text: str) -> str | None:
+        """Return cached response content for the prompt, or None on a miss"""
+        ...
+
+    async def set(self, namespace: str, prompt_text: str, content: str) -> None:
+        """Store response content for the prompt"""
+        ...
+
+
+def response_cache_key(namespace: str, prompt_text: str) -> str:
+    """Stable key for a fully rendered prompt within a namespace"""
+    digest = hashlib.sha256()
+    digest.update(namespace.encode())
+    digest.update(b"\0")
+    digest.update(prompt_text.encode())
+    return digest.hexdigest()
+
+
+class InMemoryResponseCache:
+    """Process-local LRU cache of raw LLM response content, keyed on exact prompts"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    async def get(self, namespace: str, prompt_text: str) -> str | None:
+        key = response_cache_key(namespace, prompt_text)
+        content = self._entries.get(key)
+        if content is not None:
+            self._entries.move_to_end(key)
+        return content
+
+    async def set(self, namespace: str, prompt_text: str, content: str) -> None:
+        key = response_cache_key(namespace, prompt_text)
+        self._entries[key] = content
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,11 +1,16 @@
 """Observation models for the cognitive architecture"""
 
 from .models import (
+    ActionChosenPayload,
     ConversationMessage,
     ConversationObservation,
     EntityData,
+    ErrorPayload,
+    InteractionEventPayload,
     MindEvent,
+    MindEventPayload,
     MindEventType,
+    MovementCompletedPayload,
     NeedsObservation,
     Observation,
     StatusObservation,
@@ -13,11 +18,16 @@ from .models import (
 )
 
 __all__ = [
+    "ActionChosenPayload",
     "ConversationMessage",
     "ConversationObservation",
     "EntityData",
+    "ErrorPayload",
+    "InteractionEventPayload",
     "MindEvent",
+    "MindEventPayload",
     "MindEventType",
+    "MovementCompletedPayload",
     "NeedsObservation",
     "Observation",
     "StatusObservation",
@@ -1,8 +1,10 @@
 """Observation models for the cognitive architecture"""
 
+from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import cache
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class MindEventType(StrEnum):
@@ -22,6 +24,95 @@ class MindEventType(StrEnum):
     # OBSERVATION not included - handled separately as main observation field
 
 
+@dataclass(slots=True, frozen=True)
+class InteractionEventPayload:
+    """Payload shared by the interaction lifecycle and bid events"""
+
+    interaction_name: str = "unknown"
+    reason: str = ""
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "InteractionEventPayload":
+        return cls(
+            interaction_name=payload.get("interaction_name", "unknown"),
+            reason=payload.get("reason", ""),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class ErrorPayload:
+    """Payload for ERROR events"""
+
+    message: str = "Unknown error"
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "ErrorPayload":
+        return cls(message=payload.get("message", "Unknown error"))
+
+
+@dataclass(slots=True, frozen=True)
+class MovementCompletedPayload:
+    """Payload for MOVEMENT_COMPLETED events"""
+
+    status: str = "UNKNOWN"
+    intended_destination: tuple[int, int] | None = None
+    actual_destination: tuple[int, int] | None = None
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "MovementCompletedPayload":
+        intended = payload.get("intended_destination")
+        actual = payload.get("actual_destination")
+        return cls(
+            status=payload.get("status", "UNKNOWN"),
+            intended_destination=tuple(intended) if intended is not None else None,
+            actual_destination=tuple(actual) if actual is not None else None,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class ActionChosenPayload:
+    """Payload for ACTION_CHOSEN events"""
+
+    action: str = "unknown"
+    parameters: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "ActionChosenPayload":
+        return cls(
+            action=payload.get("action", "unknown"),
+            parameters=payload.get("parameters", {}),
+        )
+
+
+MindEventPayload = (
+    InteractionEventPayload | ErrorPayload | MovementCompletedPayload | ActionChosenPayload
+)
+
+_PAYLOAD_TYPES: dict[MindEventType, type[MindEventPayload]] = {
+    MindEventType.INTERACTION_BID_PENDING: InteractionEventPayload,
+    MindEventType.INTERACTION_BID_REJECTED: InteractionEventPayload,
+    MindEventType.INTERACTION_BID_RECEIVED: InteractionEventPayload,
+    MindEventType.INTERACTION_BID_CANCELED: InteractionEventPayload,
+    MindEventType.INTERACTION_STARTED: InteractionEventPayload,
+    MindEventType.INTERACTION_CANCELED: InteractionEventPayload,
+    MindEventType.INTERACTION_FINISHED: InteractionEventPayload,
+    MindEventType.MOVEMENT_COMPLETED: MovementCompletedPayload,
+    MindEventType.ACTION_CHOSEN: ActionChosenPayload,
+    MindEventType.ERROR: ErrorPayload,
+}
+
+# Sentence prefix for each event type carried by an InteractionEventPayload
+_INTERACTION_EVENT_LABELS: dict[MindEventType, str] = {
+    MindEventType.INTERACTION_BID_PENDING: "Interaction bid pending",
+    MindEventType.INTERACTION_BID_REJECTED: "Interaction bid rejected",
+    MindEventType.INTERACTION_BID_RECEIVED: "Interaction bid received",
+    MindEventType.INTERACTION_BID_CANCELED: "Interaction bid canceled",
+    MindEventType.INTERACTION_STARTED: "Interaction started",
+    MindEventType.INTERACTION_CANCELED: "Interaction canceled",
+    MindEventType.INTERACTION_FINISHED: "Interaction finished",
+}
+
+
 class MindEvent(BaseModel):
     """Mind event with typed payload matching Godot MindEvent structure"""
 
@@ -29,55 +120,46 @@ class MindEvent(BaseModel):
     event_type: MindEventType
     payload: dict  # Serialized observation data from Godot
 
-    def __str__(self) -> str:
-        """Format event as natural language for LLM"""
-        event_type = self.event_type
-        payload = self.payload
-
-        if event_type == MindEventType.INTERACTION_BID_REJECTED:
-            interaction_name = payload.get("interaction_name", "unknown")
-            reason = payload.get("reason", "")
-            if reason:
-                return f"Interaction bid rejected: {interaction_name} (Reason: {reason})"
-            else:
-                return f"Interaction bid rejected: {interaction_name}"
-
-        elif event_type == MindEventType.INTERACTION_STARTED:
-            interaction_name = payload.get("interaction_name", "unknown")
-            return f"Interaction started: {interaction_name}"
-
-        elif event_type == MindEventType.INTERACTION_FINISHED:
-            interaction_name = payload.get("interaction_name", "unknown")
-            return f"Interaction finished: {interaction_name}"
+    _typed_payload: MindEventPayload | None = PrivateAttr(default=None)
 
-        elif event_type == MindEventType.INTERACTION_CANCELED:
-            interaction_name = payload.get("interaction_name", "unknown")
-            return f"Interaction canceled: {interaction_name}"
+    @property
+    def typed_payload(self) -> MindEventPayload | None:
+        """Slotted view of ``payload`` chosen by ``event_type``.
 
-        elif event_type == MindEventType.ERROR:
-            message = payload.get("message", "Unknown error")
-            return f"Error: {message}"
+        ``payload`` stays a plain dict because it is the wire format shared with
+        Godot (and INTERACTION_OBSERVATION payloads are re-validated as
+        ConversationObservation). Events are formatted on every decision while
+        they sit in the recent-events buffer, so the keyed lookups are done once
+        here and cached. Returns ``None`` for event types without a typed payload.
+        """
+        if self._typed_payload is None:
+            payload_type = _PAYLOAD_TYPES.get(self.event_type)
+            if payload_type is not None:
+                self._typed_payload = payload_type.from_dict(self.payload)
+        return self._typed_payload
 
-        elif event_type == MindEventType.INTERACTION_BID_PENDING:
-            interaction_name = payload.get("interaction_name", "unknown")
-            return f"Interaction bid pending: {interaction_name}"
+    def __str__(self) -> str:
+        """Format event as natural language for LLM"""
+        event_type = self.event_type
+        payload = self.typed_payload
 
-        elif event_type == MindEventType.INTERACTION_BID_RECEIVED:
-            interaction_name = payload.get("interaction_name", "unknown")
-            return f"Interaction bid received: {interaction_name}"
+        if isinstance(payload, InteractionEventPayload):
+            label = _INTERACTION_EVENT_LABELS[event_type]
+            if event_type == MindEventType.INTERACTION_BID_REJECTED and payload.reason:
+                return f"{label}: {payload.interaction_name} (Reason: {payload.reason})"
+            return f"{label}: {payload.interaction_name}"
 
-        elif event_type == MindEventType.INTERACTION_BID_CANCELED:
-            interaction_name = payload.get("interaction_name", "unknown")
-            return f"Interaction bid canceled: {interaction_name}"
+        elif isinstance(payload, ErrorPayload):
+            return f"Error: {payload.message}"
 
         elif event_type == MindEventType.INTERACTION_OBSERVATION:
             # Interaction update - format based on payload
-            return f"Interaction update: {payload}"
+            return f"Interaction update: {self.payload}"
 
-        elif event_type == MindEventType.MOVEMENT_COMPLETED:
-            status = payload.get("status", "UNKNOWN")
-            actual_dest = payload.get("actual_destination")
-            intended_dest = payload.get("intended_destination")
+        elif isinstance(payload, MovementCompletedPayload):
+            status = payload.status
+            actual_dest = payload.actual_destination
+            intended_dest = payload.intended_destination
 
             if status == "ARRIVED":
                 return f"Arrived at ({actual_dest[0]}, {actual_dest[1]})"
@@ -88,19 +170,65 @@ class MindEvent(BaseModel):
             else:
                 return f"Movement completed with status {status}"
 
-        elif event_type == MindEventType.ACTION_CHOSEN:
-            action_name = payload.get("action", "unknown")
-            params = payload.get("parameters", {})
+        elif isinstance(payload, ActionChosenPayload):
+            params = payload.parameters
             if params:
                 params_str = ", ".join([f"{k}={v}" for k, v in params.items()])
-                return f"Chose action: {action_name}({params_str})"
+                return f"Chose action: {payload.action}({params_str})"
             else:
-                return f"Chose action: {action_name}"
+                return f"Chose action: {payload.action}"
 
         else:
             return f"Unknown event type: {event_type}"
 
 
+# Fixed parameter descriptions for the bid actions; only the bid id varies per bid
+_BATCH_REJECT_PARAMETERS = {
+    "ids": "'*' to reject all, or list of bid IDs like ['bid_xxx', 'bid_yyy'], or list of entity IDs to reject all bids from those entities",
+    "reason": "Reason for rejecting these bids",
+}
+_BID_RESPONSE_PARAMETERS = {
+    "accept": "Boolean - true to accept the bid, false to reject the bid",
+    "reason": "Optional string - reason for accepting/rejecting (required when rejecting)",
+}
+
+
+@cache
+def _static_available_actions() -> dict:
+    """Actions whose wording never depends on the observation, built once per process.
+
+    get_available_actions runs on every decision; only bid responses, interaction
+    actions and entity affordances vary, so the fixed general actions are shared
+    (AvailableAction is frozen) instead of re-validated each tick.
+    """
+    # Import here to avoid circular dependency (actions imports observations for validation)
+    from ..actions import ActionType, AvailableAction
+
+    return {
+        ActionType.MOVE_TO: AvailableAction(
+            name=ActionType.MOVE_TO,
+            description="Move to a specific grid position",
+            parameters={"destination": "Grid coordinates as tuple (x, y)"},
+        ),
+        ActionType.WANDER: AvailableAction(
+            name=ActionType.WANDER,
+            description="Wander around aimlessly",
+        ),
+        ActionType.WAIT: AvailableAction(
+            name=ActionType.WAIT,
+            description="Wait and observe surroundings",
+        ),
+        ActionType.CONTINUE: AvailableAction(
+            name=ActionType.CONTINUE,
+            description="Continue current movement without changes",
+        ),
+        ActionType.CANCEL_INTERACTION: AvailableAction(
+            name=ActionType.CANCEL_INTERACTION,
+            description="Cancel the current interaction",
+        ),
+    }
+
+
 class StatusObservation(BaseModel):
     """Physical and activity state"""
 
@@ -277,6 +405,7 @@ class Observation(BaseModel):
         # Import here to avoid circular dependency (actions imports observations for validation)
         from ..actions import ActionType, AvailableAction
 
+        static_actions = _static_available_actions()
         actions = []
 
         # Bid response actions (highest priority - check first)
@@ -293,10 +422,7 @@ class Observation(BaseModel):
                     AvailableAction(
                         name=ActionType.BATCH_REJECT_INTERACTION_BIDS,
                         description=f"Reject multiple interaction bids at once ({len(pending_incoming_bids)} pending: {bid_list})",
-                        parameters={
-                            "ids": "'*' to reject all, or list of bid IDs like ['bid_xxx', 'bid_yyy'], or list of entity IDs to reject all bids from those entities",
-                            "reason": "Reason for rejecting these bids",
-                        },
+                        parameters=_BATCH_REJECT_PARAMETERS,
                     )
                 )
 
@@ -312,52 +438,26 @@ class Observation(BaseModel):
                     AvailableAction(
                         name=ActionType.RESPOND_TO_INTERACTION_BID,
                         description=f"Respond to {interaction_name} bid {bid_id} from {bidder_name}",
-                        parameters={
-                            "bid_id": f"{bid_id}",
-                            "accept": "Boolean - true to accept the bid, false to reject the bid",
-                            "reason": "Optional string - reason for accepting/rejecting (required when rejecting)",
-                        },
+                        parameters={"bid_id": bid_id, **_BID_RESPONSE_PARAMETERS},
                     )
                 )
 
         # General actions (always available)
-        actions.append(
-            AvailableAction(
-                name=ActionType.MOVE_TO,
-                description="Move to a specific grid position",
-                parameters={"destination": "Grid coordinates as tuple (x, y)"},
-            )
-        )
-
-        actions.append(
-            AvailableAction(
-                name=ActionType.WANDER,
-                description="Wander around aimlessly",
-            )
-        )
+        actions.append(static_actions[ActionType.MOVE_TO])
+        actions.append(static_actions[ActionType.WANDER])
 
         # Wait action only available when NOT in an active interaction
         # (wait exits interactions, use cancel_interaction to explicitly end one).
         # Grounded on is_interacting() so a half-torn-down state (current_interaction
         # set but activity_state already non-interacting) still offers wait.
         if not self.is_interacting():
-            actions.append(
-                AvailableAction(
-                    name=ActionType.WAIT,
-                    description="Wait and observe surroundings",
-                )
-            )
+            actions.append(static_actions[ActionType.WAIT])
 
         # Conditional: continue action when movement or interaction is in progress
         if self.status and self.status.activity_state:
             state_name = self.status.activity_state.get("state_name", "")
             if state_name == "moving":
-                actions.append(
-                    AvailableAction(
-                        name=ActionType.CONTINUE,
-                        description="Continue current movement without changes",
-                    )
-                )
+                actions.append(static_actions[ActionType.CONTINUE])
             elif self.is_interacting():
                 interaction_name = self.status.current_interaction.get(
                     "interaction_name", "interaction"
@@ -391,12 +491,7 @@ class Observation(BaseModel):
                 )
             )
 
-            actions.append(
-                AvailableAction(
-                    name=ActionType.CANCEL_INTERACTION,
-                    description="Cancel the current interaction",
-                )
-            )
+            actions.append(static_actions[ActionType.CANCEL_INTERACTION])
 
         # Interaction-based actions from visible entities
         if self.vision:
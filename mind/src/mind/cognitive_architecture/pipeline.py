@@ -1,5 +1,7 @@
 """LangGraph cognitive pipeline implementation"""
 
+import asyncio
+
 from langchain_core.language_models import BaseChatModel
 from langgraph.graph import END, StateGraph
 
@@ -11,6 +13,7 @@ from .nodes.base import entity_tag
 from .nodes.cognitive_update.node import CognitiveUpdateNode
 from .nodes.memory_query.node import MemoryQueryNode
 from .nodes.memory_retrieval.node import MemoryRetrievalNode
+from .nodes.response_cache import ResponseCacheProtocol
 from .state import PipelineState
 
 logger = get_logger()
@@ -19,15 +22,49 @@ logger = get_logger()
 class CognitivePipeline:
     """Orchestrates the cognitive processing pipeline using LangGraph"""
 
-    def __init__(self, llm: BaseChatModel, memory_store: VectorDBMemory):
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        memory_store: VectorDBMemory,
+        response_cache: ResponseCacheProtocol | None = None,
+        structured_output: bool = False,
+        concurrency_limit: asyncio.Semaphore | None = None,
+    ):
+        """
+        Args:
+            llm: Language model shared by the LLM nodes
+            memory_store: Vector store the retrieval node queries
+            response_cache: Optional cache of LLM responses by rendered prompt,
+                handed to every LLM node. May be shared across pipelines.
+            structured_output: Have every LLM node request provider-native JSON
+                schema output. Only for models whose provider supports it.
+            concurrency_limit: Optional semaphore bounding in-flight LLM requests,
+                handed to every LLM node. Share one across pipelines to cap the load
+                all minds put on the provider together.
+        """
         self.llm = llm
         self.memory_store = memory_store
 
         # Initialize nodes
-        self.memory_query_node = MemoryQueryNode(llm)
+        self.memory_query_node = MemoryQueryNode(
+            llm,
+            response_cache=response_cache,
+            structured_output=structured_output,
+            concurrency_limit=concurrency_limit,
+        )
         self.memory_retrieval_node = MemoryRetrievalNode(memory_store)
-        self.cognitive_update_node = CognitiveUpdateNode(llm)
-        self.action_selection_node = ActionSelectionNode(llm)
+        self.cognitive_update_node = CognitiveUpdateNode(
+            llm,
+            response_cache=response_cache,
+            structured_output=structured_output,
+            concurrency_limit=concurrency_limit,
+        )
+        self.action_selection_node = ActionSelectionNode(
+            llm,
+            response_cache=response_cache,
+            structured_output=structured_output,
+            concurrency_limit=concurrency_limit,
+        )
 
         # Build the graph
         self.graph = self._build_graph()
@@ -64,7 +101,7 @@ class CognitivePipeline:
         result = PipelineState.model_validate(result_dict, context={"state": state})
 
         # Log pipeline completion summary
-        total_time = sum(result.time_ms.values())
+        total_time = sum(result.time_ns.values()) // 1_000_000
         total_tokens = sum(result.tokens_used.values())
         logger.debug(
             f"{entity_tag(state)} Pipeline completed in {total_time}ms, {total_tokens} tokens"
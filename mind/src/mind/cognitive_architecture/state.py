@@ -47,4 +47,20 @@ class PipelineState(BaseModel):
 
     # Metadata for observability (use merge function to accumulate values)
     tokens_used: Annotated[dict[str, int], merge_dicts] = Field(default_factory=dict)
-    time_ms: Annotated[dict[str, int], merge_dicts] = Field(default_factory=dict)
+    time_ns: Annotated[dict[str, int], merge_dicts] = Field(default_factory=dict)
+
+    @property
+    def time_ms(self) -> dict[str, float]:
+        """Per-step wall time in milliseconds, converted from time_ns.
+
+        Returns a freshly computed copy, so writes to it are lost; record timings
+        with record() instead.
+        """
+        return {step: ns / 1_000_000 for step, ns in self.time_ns.items()}
+
+    def record(self, step_name: str, *, tokens: int = 0, ns: int | None = None) -> None:
+        """Record observability metrics for a step (zero token counts are not recorded)"""
+        if tokens:
+            self.tokens_used[step_name] = tokens
+        if ns is not None:
+            self.time_ns[step_name] = ns
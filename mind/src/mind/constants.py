@@ -23,3 +23,6 @@ DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 DEFAULT_MEMORY_STORAGE_PATH = "./chroma_db"
 DEFAULT_MEMORIES_PER_QUERY = 2
 DEFAULT_MAX_RETRIEVED_MEMORIES = 5
+
+# LLM Request Limits
+DEFAULT_MAX_CONCURRENT_LLM_REQUESTS = 8  # In flight at once across all hosted minds
@@ -1,11 +1,13 @@
 """Mind runtime state and behavior"""
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import Self
 
 from mind.apis.langchain_llm import get_llm
 from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
 from mind.cognitive_architecture.nodes.cognitive_update.models import NewMemory, WorkingMemory
+from mind.cognitive_architecture.nodes.response_cache import ResponseCacheProtocol
 from mind.cognitive_architecture.observations import ConversationMessage, MindEvent, MindEventType
 from mind.cognitive_architecture.pipeline import CognitivePipeline
 from mind.interfaces.mcp.models import MindConfig
@@ -40,7 +42,14 @@ class Mind:
     pending_incoming_bids: dict[str, MindEvent] = field(default_factory=dict)
 
     @classmethod
-    def from_config(cls, mind_id: str, entity_id: str, config: MindConfig) -> Self:
+    def from_config(
+        cls,
+        mind_id: str,
+        entity_id: str,
+        config: MindConfig,
+        response_cache: ResponseCacheProtocol | None = None,
+        concurrency_limit: asyncio.Semaphore | None = None,
+    ) -> Self:
         """Create a Mind instance from configuration
 
         Args:
@@ -48,6 +57,10 @@ class Mind:
             entity_id: The simulation entity this mind drives (FK) - deliberately
                 independent of mind_id; carried for per-NPC log attribution
             config: MindConfig with traits, LLM, memory, and personality settings
+            response_cache: Optional LLM response cache for the pipeline, typically
+                shared across every mind the server hosts
+            concurrency_limit: Optional semaphore bounding the pipeline's in-flight
+                LLM requests, typically shared across every mind the server hosts
 
         Returns:
             Initialized Mind instance
@@ -63,11 +76,22 @@ class Mind:
         )
 
         # Seed initial long-term memories
-        for memory_content in config.initial_long_term_memories:
-            memory_store.add_memory(content=memory_content, importance=5.0)
+        if config.initial_long_term_memories:
+            memory_store.add_memories(
+                [
+                    {"content": memory_content, "importance": 5.0}
+                    for memory_content in config.initial_long_term_memories
+                ]
+            )
 
         # Initialize pipeline
-        pipeline = CognitivePipeline(llm=llm, memory_store=memory_store)
+        pipeline = CognitivePipeline(
+            llm=llm,
+            memory_store=memory_store,
+            response_cache=response_cache,
+            structured_output=config.llm_structured_output,
+            concurrency_limit=concurrency_limit,
+        )
 
         # Initialize working memory
         working_memory = config.initial_working_memory or WorkingMemory()
@@ -84,7 +108,14 @@ class Mind:
         )
 
     @classmethod
-    def reattach(cls, mind_id: str, entity_id: str, config: MindConfig) -> Self:
+    def reattach(
+        cls,
+        mind_id: str,
+        entity_id: str,
+        config: MindConfig,
+        response_cache: ResponseCacheProtocol | None = None,
+        concurrency_limit: asyncio.Semaphore | None = None,
+    ) -> Self:
         """Re-attach a Mind to its retained memory collection.
 
         Identical to from_config except it does NOT seed
@@ -100,6 +131,10 @@ class Mind:
                 from the entity the mind drove before release; the relink rebinds it.
             config: MindConfig with traits, LLM, memory, and personality settings.
                 initial_long_term_memories is intentionally ignored here.
+            response_cache: Optional LLM response cache for the pipeline, typically
+                shared across every mind the server hosts
+            concurrency_limit: Optional semaphore bounding the pipeline's in-flight
+                LLM requests, typically shared across every mind the server hosts
 
         Returns:
             Initialized Mind instance bound to the existing collection
@@ -115,7 +150,13 @@ class Mind:
         )
 
         # Initialize pipeline
-        pipeline = CognitivePipeline(llm=llm, memory_store=memory_store)
+        pipeline = CognitivePipeline(
+            llm=llm,
+            memory_store=memory_store,
+            response_cache=response_cache,
+            structured_output=config.llm_structured_output,
+            concurrency_limit=concurrency_limit,
+        )
 
         # Initialize working memory
         working_memory = config.initial_working_memory or WorkingMemory()
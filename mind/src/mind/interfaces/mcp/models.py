@@ -25,6 +25,9 @@ class MindConfig(BaseModel):
 
     # LLM configuration
     llm_model: str = LangChainModel.GEMINI_FLASH_LITE  # LangChain model identifier
+    # Request provider-native JSON schema output. Only for models whose provider
+    # supports json_schema response_format; an unsupported one fails every LLM call.
+    llm_structured_output: bool = False
 
     # Memory configuration. The defaults live in mind.constants so there is a single
     # named source for them: relink_mind/forget_mind need to name the default storage
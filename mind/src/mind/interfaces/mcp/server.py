@@ -1,5 +1,6 @@
 """MCP server for mind management"""
 
+import asyncio
 import json
 import os
 import uuid
@@ -10,6 +11,7 @@ from pydantic import ValidationError
 from mind.cognitive_architecture.actions import ActionType
 from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
 from mind.cognitive_architecture.nodes.memory_consolidation.node import MemoryConsolidationNode
+from mind.cognitive_architecture.nodes.response_cache import InMemoryResponseCache
 from mind.cognitive_architecture.observations import (
     ConversationObservation,
     MindEvent,
@@ -17,7 +19,7 @@ from mind.cognitive_architecture.observations import (
     Observation,
 )
 from mind.cognitive_architecture.state import PipelineState
-from mind.constants import DEFAULT_MEMORY_STORAGE_PATH
+from mind.constants import DEFAULT_MAX_CONCURRENT_LLM_REQUESTS, DEFAULT_MEMORY_STORAGE_PATH
 from mind.logging_config import get_logger
 
 from .mind import Mind
@@ -181,6 +183,17 @@ class MCPServer:
         # itself. See _config_for.
         self.mind_configs: dict[str, MindConfig] = {}
 
+        # One response cache for every hosted mind. A decide_action re-sent with an
+        # unchanged observation (e.g. a client retry after a timeout) renders the same
+        # prompts, and get_llm runs at temperature 0, so the cached response is the one
+        # the provider would return anyway. Entries are namespaced by step and model.
+        self.response_cache = InMemoryResponseCache()
+
+        # One cap on in-flight LLM requests across every hosted mind. FastMCP runs
+        # decide_action calls concurrently, so without it a burst of NPC ticks sends
+        # every pipeline's requests to the provider at once.
+        self.llm_concurrency = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_LLM_REQUESTS)
+
         # Create MCP server
         self.mcp = FastMCP(name)
 
@@ -309,7 +322,13 @@ class MCPServer:
                 config: Cognitive configuration - traits, LLM settings, memory
                     settings, personality dimensions, initial state.
             """
-            mind = Mind.from_config(mind_id, entity_id, config)
+            mind = Mind.from_config(
+                mind_id,
+                entity_id,
+                config,
+                response_cache=self.response_cache,
+                concurrency_limit=self.llm_concurrency,
+            )
             self.minds[mind_id] = mind
             # Remember how this mind was built - not just where it lives - so a later
             # relink/forget can address it and rehydrate it faithfully once it is no
@@ -360,8 +379,9 @@ class MCPServer:
                     obs = Observation.model_validate(observation)
                 except ValidationError as e:
                     logger.exception(f"[{request_id}] Observation validation failed for {mind_id}")
+                    details = str(e)
                     return _error_response(
-                        request_id, f"Invalid observation format: {str(e)}", details=str(e)
+                        request_id, f"Invalid observation format: {details}", details=details
                     )
 
                 # Deserialize and validate events if provided
@@ -371,8 +391,9 @@ class MCPServer:
                         mind_events = [MindEvent.model_validate(e) for e in events]
                     except ValidationError as e:
                         logger.exception(f"[{request_id}] Event validation failed for {mind_id}")
+                        details = str(e)
                         return _error_response(
-                            request_id, f"Invalid event format: {str(e)}", details=str(e)
+                            request_id, f"Invalid event format: {details}", details=details
                         )
 
                 # Defensive misrouting check: mind_id (PK) routes the request while the
@@ -550,7 +571,13 @@ class MCPServer:
             # model that wrote the stored vectors. See self.mind_configs.
             config = self._config_for(mind_id, memory_storage_path)
             if VectorDBMemory.collection_exists(config.memory_storage_path, f"mind_{mind_id}"):
-                mind = Mind.reattach(mind_id, entity_id, config)
+                mind = Mind.reattach(
+                    mind_id,
+                    entity_id,
+                    config,
+                    response_cache=self.response_cache,
+                    concurrency_limit=self.llm_concurrency,
+                )
                 self.minds[mind_id] = mind
                 self.mind_configs[mind_id] = self._config_to_record(config)
                 return MindInfoResponse(status="relinked", mind_id=mind_id, entity_id=entity_id)
@@ -1,5 +1,6 @@
 """Test fixtures for integration testing"""
 
+from .llm import FakeLLM
 from .observations import (
     create_blacksmith_config,
     create_blacksmith_observation,
@@ -12,6 +13,7 @@ from .observations import (
 )
 
 __all__ = [
+    "FakeLLM",
     "create_blacksmith_observation",
     "create_explorer_observation",
     "create_conversation_observation",
@@ -0,0 +1,25 @@
+"""Lightweight LLM fake for unit tests
+
+Cheaper than an AsyncMock tree: no child mocks are allocated per attribute access
+and calls are counted with a plain int instead of recorded.
+"""
+
+from langchain_core.messages import AIMessage
+
+
+class FakeLLM:
+    """Chat model stand-in that returns preseeded responses in order.
+
+    The last response is repeated once the others are used up, so a single
+    response behaves like a fixed return value.
+    """
+
+    def __init__(self, responses: list[AIMessage]):
+        self.responses = list(responses)
+        self.call_count = 0
+
+    async def ainvoke(self, messages, **kwargs) -> AIMessage:
+        self.call_count += 1
+        if len(self.responses) > 1:
+            return self.responses.pop(0)
+        return self.responses[0]
@@ -6,6 +6,7 @@ from mind.cognitive_architecture.observations import (
     EntityData,
     MindEvent,
     MindEventType,
+    MovementCompletedPayload,
     NeedsObservation,
     Observation,
     StatusObservation,
@@ -222,6 +223,35 @@ class TestMindEvent:
         formatted = str(event)
         assert formatted == "Could not move to (10, 20), no valid path"
 
+    def test_typed_payload_chosen_by_event_type(self):
+        """Should expose a typed payload view without changing the dict payload"""
+        event = MindEvent(
+            timestamp=100,
+            event_type=MindEventType.MOVEMENT_COMPLETED,
+            payload={
+                "status": "ARRIVED",
+                "intended_destination": [10, 20],
+                "actual_destination": [10, 20],
+            },
+        )
+
+        payload = event.typed_payload
+        assert isinstance(payload, MovementCompletedPayload)
+        assert payload.actual_destination == (10, 20)
+        assert event.typed_payload is payload  # Parsed once, then cached
+        assert event.payload["status"] == "ARRIVED"
+
+    def test_typed_payload_none_for_untyped_event(self):
+        """Should leave INTERACTION_OBSERVATION payloads as raw dicts"""
+        event = MindEvent(
+            timestamp=100,
+            event_type=MindEventType.INTERACTION_OBSERVATION,
+            payload={"interaction_id": "conv_1"},
+        )
+
+        assert event.typed_payload is None
+        assert str(event) == "Interaction update: {'interaction_id': 'conv_1'}"
+
 
 class TestBidActionGeneration:
     """Test generation of bid response actions"""
@@ -283,3 +313,21 @@ class TestBidActionGeneration:
         # Should have no bid response actions
         bid_actions = [a for a in actions if a.name == ActionType.RESPOND_TO_INTERACTION_BID]
         assert len(bid_actions) == 0
+
+    def test_general_actions_shared_across_calls(self):
+        """Should reuse the fixed general actions rather than rebuilding them each tick"""
+        obs = Observation(
+            entity_id="test_npc",
+            current_simulation_time=100,
+            status=StatusObservation(position=(0, 0), movement_locked=False),
+        )
+
+        first = {a.name: a for a in obs.get_available_actions()}
+        second = {a.name: a for a in obs.get_available_actions()}
+
+        assert first["move_to"] is second["move_to"]
+        assert first["wait"] is second["wait"]
+        assert str(first["move_to"]) == (
+            "move_to: Move to a specific grid position "
+            "(params: destination: Grid coordinates as tuple (x, y))"
+        )
@@ -1,24 +1,63 @@
 """Unit tests for base node classes"""
 
+import asyncio
 import json
 import logging
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import PromptTemplate
 from pydantic import BaseModel, ValidationError
 
 from mind.cognitive_architecture.nodes.base import LLMNode, Node, entity_tag
+from mind.cognitive_architecture.nodes.response_cache import InMemoryResponseCache
 from mind.cognitive_architecture.observations import Observation, StatusObservation
 from mind.cognitive_architecture.state import PipelineState
+from tests.fixtures import FakeLLM
+
+
+@pytest.fixture(scope="module")
+def state_prototype():
+    """Minimal pipeline state built once per module; tests get a copy via `state`"""
+    return PipelineState(
+        observation=Observation(
+            entity_id="test",
+            current_simulation_time=0,
+            status=StatusObservation(position=(0, 0), movement_locked=False),
+        )
+    )
+
+
+@pytest.fixture
+def state(state_prototype):
+    """Fresh deep copy of the prototype state for a single test"""
+    return state_prototype.model_copy(deep=True)
+
+
+class ValueOutput(BaseModel):
+    """Single-field output model for LLMNode tests"""
+
+    value: str
+
+
+@pytest.fixture
+def make_node():
+    """Build an LLMNode over an "{input}" prompt, parsing into ValueOutput by default"""
+
+    def _make_node(llm, **kwargs) -> LLMNode:
+        kwargs.setdefault("output_model", ValueOutput)
+        return LLMNode(llm=llm, prompt=PromptTemplate.from_template("{input}"), **kwargs)
+
+    return _make_node
 
 
 class TestNodeTimingDecorator:
     """Test Node base class timing functionality"""
 
     @pytest.mark.asyncio
-    async def test_node_tracks_timing_automatically(self):
+    async def test_node_tracks_timing_automatically(self, state):
         """Node subclasses should automatically track timing"""
 
         class TestNode(Node):
@@ -28,20 +67,36 @@ class TestNodeTimingDecorator:
                 return state
 
         node = TestNode()
-        state = PipelineState(
-            observation=Observation(
-                entity_id="test",
-                current_simulation_time=0,
-                status=StatusObservation(position=(0, 0), movement_locked=False),
-            )
-        )
-
         result = await node.process(state)
 
         assert "test_step" in result.time_ms
         assert result.time_ms["test_step"] >= 0
 
 
+class TestPipelineStateRecord:
+    """Test PipelineState.record metric helper"""
+
+    def test_records_tokens_and_time(self, state):
+        """Should write both metrics for the step"""
+        state.record("step", tokens=12, ns=34_000_000)
+
+        assert state.tokens_used == {"step": 12}
+        assert state.time_ns == {"step": 34_000_000}
+
+    def test_time_ms_converts_from_nanoseconds(self, state):
+        """Should expose millisecond timings derived from time_ns"""
+        state.record("step", ns=1_500_000)
+
+        assert state.time_ms == {"step": 1.5}
+
+    def test_skips_zero_tokens(self, state):
+        """Should not record a zero token count"""
+        state.record("step", tokens=0, ns=5)
+
+        assert "step" not in state.tokens_used
+        assert state.time_ns["step"] == 5
+
+
 class TestLLMNodeInitialization:
     """Test LLMNode initialization and configuration"""
 
@@ -59,9 +114,28 @@ class TestLLMNodeInitialization:
         assert node.llm == mock_llm
         assert node.prompt == prompt
         assert node.output_model == TestOutput
-        assert node.parser is not None
+        assert "IMPORTANT: Output ONLY raw JSON" in node.get_format_instructions()
         assert node.max_retries == 0
 
+    def test_format_instructions_rendered_once(self):
+        """Should render format instructions at init rather than per call"""
+
+        class TestOutput(BaseModel):
+            value: str
+
+        prompt = PromptTemplate.from_template("Test {input}")
+        with patch(
+            "mind.cognitive_architecture.nodes.base.PydanticOutputParser",
+            wraps=PydanticOutputParser,
+        ) as parser_cls:
+            node = LLMNode(llm=AsyncMock(), prompt=prompt, output_model=TestOutput)
+            first = node.get_format_instructions()
+            second = node.get_format_instructions()
+
+        assert parser_cls.call_count == 1
+        assert first is second
+        assert '"value"' in first
+
     def test_init_with_raw_string_output(self):
         """Should initialize for raw string output"""
         mock_llm = AsyncMock()
@@ -70,7 +144,7 @@ class TestLLMNodeInitialization:
         node = LLMNode(llm=mock_llm, prompt=prompt, output_model=None)
 
         assert node.output_model is None
-        assert node.parser is None
+        assert node.get_format_instructions() == ""
 
     def test_init_with_max_retries(self):
         """Should accept max_retries parameter"""
@@ -98,52 +172,42 @@ class TestLLMNodeRawStringOutput:
     """Test LLMNode with raw string output"""
 
     @pytest.mark.asyncio
-    async def test_call_llm_returns_raw_string(self):
+    async def test_call_llm_returns_raw_string(self, state):
         """Should return raw string when output_model is None"""
-        mock_llm = AsyncMock()
-        mock_llm.ainvoke.return_value = AIMessage(
-            content="This is a raw response",
-            usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        fake_llm = FakeLLM(
+            [
+                AIMessage(
+                    content="This is a raw response",
+                    usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+                )
+            ]
         )
 
         prompt = PromptTemplate.from_template("Test {input}")
-        node = LLMNode(llm=mock_llm, prompt=prompt, output_model=None)
+        node = LLMNode(llm=fake_llm, prompt=prompt, output_model=None)
         node.step_name = "test_step"
 
-        state = PipelineState(
-            observation=Observation(
-                entity_id="test",
-                current_simulation_time=0,
-                status=StatusObservation(position=(0, 0), movement_locked=False),
-            )
-        )
-
         result = await node.call_llm(state, input="hello")
 
         assert result == "This is a raw response"
         assert isinstance(result, str)
 
     @pytest.mark.asyncio
-    async def test_raw_string_tracks_tokens(self):
+    async def test_raw_string_tracks_tokens(self, state):
         """Should track tokens for raw string output"""
-        mock_llm = AsyncMock()
-        mock_llm.ainvoke.return_value = AIMessage(
-            content="Response",
-            usage_metadata={"input_tokens": 20, "output_tokens": 10, "total_tokens": 30},
+        fake_llm = FakeLLM(
+            [
+                AIMessage(
+                    content="Response",
+                    usage_metadata={"input_tokens": 20, "output_tokens": 10, "total_tokens": 30},
+                )
+            ]
         )
 
         prompt = PromptTemplate.from_template("{input}")
-        node = LLMNode(llm=mock_llm, prompt=prompt, output_model=None)
+        node = LLMNode(llm=fake_llm, prompt=prompt, output_model=None)
         node.step_name = "test_step"
 
-        state = PipelineState(
-            observation=Observation(
-                entity_id="test",
-                current_simulation_time=0,
-                status=StatusObservation(position=(0, 0), movement_locked=False),
-            )
-        )
-
         await node.call_llm(state, input="test")
 
         assert state.tokens_used["test_step"] == 30
@@ -153,31 +217,26 @@ class TestLLMNodeStructuredOutput:
     """Test LLMNode with Pydantic structured output"""
 
     @pytest.mark.asyncio
-    async def test_call_llm_returns_parsed_model(self):
+    async def test_call_llm_returns_parsed_model(self, state):
         """Should parse and return Pydantic model"""
 
         class TestOutput(BaseModel):
             message: str
             count: int
 
-        mock_llm = AsyncMock()
-        mock_llm.ainvoke.return_value = AIMessage(
-            content='{"message": "hello", "count": 42}',
-            usage_metadata={"input_tokens": 10, "output_tokens": 8, "total_tokens": 18},
+        fake_llm = FakeLLM(
+            [
+                AIMessage(
+                    content='{"message": "hello", "count": 42}',
+                    usage_metadata={"input_tokens": 10, "output_tokens": 8, "total_tokens": 18},
+                )
+            ]
         )
 
         prompt = PromptTemplate.from_template("{input}")
-        node = LLMNode(llm=mock_llm, prompt=prompt, output_model=TestOutput)
+        node = LLMNode(llm=fake_llm, prompt=prompt, output_model=TestOutput)
         node.step_name = "test_step"
 
-        state = PipelineState(
-            observation=Observation(
-                entity_id="test",
-                current_simulation_time=0,
-                status=StatusObservation(position=(0, 0), movement_locked=False),
-            )
-        )
-
         result = await node.call_llm(state, input="test")
 
         assert isinstance(result, TestOutput)
@@ -185,210 +244,198 @@ class TestLLMNodeStructuredOutput:
         assert result.count == 42
 
     @pytest.mark.asyncio
-    async def test_structured_output_tracks_tokens(self):
+    async def test_structured_output_tracks_tokens(self, state):
         """Should track tokens for structured output"""
 
         class TestOutput(BaseModel):
             value: str
 
-        mock_llm = AsyncMock()
-        mock_llm.ainvoke.return_value = AIMessage(
-            content='{"value": "test"}',
-            usage_metadata={"input_tokens": 15, "output_tokens": 5, "total_tokens": 20},
+        fake_llm = FakeLLM(
+            [
+                AIMessage(
+                    content='{"value": "test"}',
+                    usage_metadata={"input_tokens": 15, "output_tokens": 5, "total_tokens": 20},
+                )
+            ]
         )
 
         prompt = PromptTemplate.from_template("{input}")
-        node = LLMNode(llm=mock_llm, prompt=prompt, output_model=TestOutput)
+        node = LLMNode(llm=fake_llm, prompt=prompt, output_model=TestOutput)
         node.step_name = "test_step"
 
-        state = PipelineState(
-            observation=Observation(
-                entity_id="test",
-                current_simulation_time=0,
-                status=StatusObservation(position=(0, 0), movement_locked=False),
-            )
-        )
-
         await node.call_llm(state, input="test")
 
         assert state.tokens_used["test_step"] == 20
 
 
+class TestLLMNodeOutputValidation:
+    """Test single-pass validation with json_repair fallback"""
+
+    def test_valid_json_skips_repair(self, state, make_node):
+        """Should validate well-formed JSON without invoking json_repair"""
+        node = make_node(AsyncMock())
+        with patch("mind.cognitive_architecture.nodes.base.json_repair_loads") as mock_repair:
+            result = node._validate_output('{"value": "test"}', state)
+        assert result.value == "test"
+        mock_repair.assert_not_called()
+
+    def test_malformed_json_falls_back_to_repair(self, state, make_node):
+        """Should repair fenced / trailing-comma JSON"""
+        node = make_node(AsyncMock())
+        result = node._validate_output('```json\n{"value": "test",}\n```', state)
+        assert result.value == "test"
+
+    def test_schema_error_raised_without_repair(self, state, make_node):
+        """Should raise schema errors directly rather than re-parsing"""
+        node = make_node(AsyncMock())
+        with patch("mind.cognitive_architecture.nodes.base.json_repair_loads") as mock_repair:
+            with pytest.raises(ValidationError):
+                node._validate_output('{"value": 1}', state)
+        mock_repair.assert_not_called()
+
+
 class TestLLMNodeRetryLogic:
     """Test LLMNode retry logic with validation"""
 
     @pytest.mark.asyncio
-    async def test_retry_on_json_decode_error(self):
+    async def test_retry_on_json_decode_error(self, state):
         """Should retry when LLM returns invalid JSON"""
 
         class TestOutput(BaseModel):
             value: str
 
-        mock_llm = AsyncMock()
-        mock_llm.ainvoke.side_effect = [
-            AIMessage(
-                content="not valid json",
-                usage_metadata={"input_tokens": 10, "output_tokens": 3, "total_tokens": 13},
-            ),
-            AIMessage(
-                content='{"value": "success"}',
-                usage_metadata={"input_tokens": 12, "output_tokens": 4, "total_tokens": 16},
-            ),
-        ]
+        fake_llm = FakeLLM(
+            [
+                AIMessage(
+                    content="not valid json",
+                    usage_metadata={"input_tokens": 10, "output_tokens": 3, "total_tokens": 13},
+                ),
+                AIMessage(
+                    content='{"value": "success"}',
+                    usage_metadata={"input_tokens": 12, "output_tokens": 4, "total_tokens": 16},
+                ),
+            ]
+        )
 
         prompt = PromptTemplate.from_template("{input}")
-        node = LLMNode(llm=mock_llm, prompt=prompt, output_model=TestOutput, max_retries=1)
+        node = LLMNode(llm=fake_llm, prompt=prompt, output_model=TestOutput, max_retries=1)
         node.step_name = "test_step"
 
-        state = PipelineState(
-            observation=Observation(
-                entity_id="test",
-                current_simulation_time=0,
-                status=StatusObservation(position=(0, 0), movement_locked=False),
-            )
-        )
-
         result = await node.call_llm(state, input="test")
 
         assert result.value == "success"
-        assert mock_llm.ainvoke.call_count == 2
+        assert fake_llm.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_retry_on_validation_error(self):
+    async def test_retry_on_validation_error(self, state):
         """Should retry when Pydantic validation fails"""
 
         class TestOutput(BaseModel):
             required_field: str
 
-        mock_llm = AsyncMock()
-        mock_llm.ainvoke.side_effect = [
-            AIMessage(
-                content='{"wrong_field": "oops"}',
-                usage_metadata={"input_tokens": 10, "output_tokens": 4, "total_tokens": 14},
-            ),
-            AIMessage(
-                content='{"required_field": "correct"}',
-                usage_metadata={"input_tokens": 15, "output_tokens": 5, "total_tokens": 20},
-            ),
-        ]
+        fake_llm = FakeLLM(
+            [
+                AIMessage(
+                    content='{"wrong_field": "oops"}',
+                    usage_metadata={"input_tokens": 10, "output_tokens": 4, "total_tokens": 14},
+                ),
+                AIMessage(
+                    content='{"required_field": "correct"}',
+                    usage_metadata={"input_tokens": 15, "output_tokens": 5, "total_tokens": 20},
+                ),
+            ]
+        )
 
         prompt = PromptTemplate.from_template("{input}")
-        node = LLMNode(llm=mock_llm, prompt=prompt, output_model=TestOutput, max_retries=1)
+        node = LLMNode(llm=fake_llm, prompt=prompt, output_model=TestOutput, max_retries=1)
         node.step_name = "test_step"
 
-        state = PipelineState(
-            observation=Observation(
-                entity_id="test",
-                current_simulation_time=0,
-                status=StatusObservation(position=(0, 0), movement_locked=False),
-            )
-        )
-
         result = await node.call_llm(state, input="test")
 
         assert result.required_field == "correct"
-        assert mock_llm.ainvoke.call_count == 2
+        assert fake_llm.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_retry_exhaustion_raises_error(self):
+    async def test_retry_exhaustion_raises_error(self, state):
         """Should raise error after all retries exhausted"""
 
         class TestOutput(BaseModel):
             value: str
 
-        mock_llm = AsyncMock()
-        mock_llm.ainvoke.return_value = AIMessage(
-            content="invalid json every time",
-            usage_metadata={"input_tokens": 10, "output_tokens": 4, "total_tokens": 14},
+        fake_llm = FakeLLM(
+            [
+                AIMessage(
+                    content="invalid json every time",
+                    usage_metadata={"input_tokens": 10, "output_tokens": 4, "total_tokens": 14},
+                )
+            ]
         )
 
         prompt = PromptTemplate.from_template("{input}")
-        node = LLMNode(llm=mock_llm, prompt=prompt, output_model=TestOutput, max_retries=2)
-
-        state = PipelineState(
-            observation=Observation(
-                entity_id="test",
-                current_simulation_time=0,
-                status=StatusObservation(position=(0, 0), movement_locked=False),
-            )
-        )
+        node = LLMNode(llm=fake_llm, prompt=prompt, output_model=TestOutput, max_retries=2)
 
         with pytest.raises((json.JSONDecodeError, ValidationError)):
             await node.call_llm(state, input="test")
 
-        assert mock_llm.ainvoke.call_count == 3  # Initial + 2 retries
+        assert fake_llm.call_count == 3  # Initial + 2 retries
 
     @pytest.mark.asyncio
-    async def test_retry_tracks_all_tokens(self):
+    async def test_retry_tracks_all_tokens(self, state):
         """Should track tokens from all retry attempts"""
 
         class TestOutput(BaseModel):
             value: str
 
-        mock_llm = AsyncMock()
-        mock_llm.ainvoke.side_effect = [
-            AIMessage(
-                content="bad",
-                usage_metadata={"input_tokens": 10, "output_tokens": 1, "total_tokens": 11},
-            ),
-            AIMessage(
-                content="also bad",
-                usage_metadata={"input_tokens": 12, "output_tokens": 2, "total_tokens": 14},
-            ),
-            AIMessage(
-                content='{"value": "good"}',
-                usage_metadata={"input_tokens": 14, "output_tokens": 4, "total_tokens": 18},
-            ),
-        ]
+        fake_llm = FakeLLM(
+            [
+                AIMessage(
+                    content="bad",
+                    usage_metadata={"input_tokens": 10, "output_tokens": 1, "total_tokens": 11},
+                ),
+                AIMessage(
+                    content="also bad",
+                    usage_metadata={"input_tokens": 12, "output_tokens": 2, "total_tokens": 14},
+                ),
+                AIMessage(
+                    content='{"value": "good"}',
+                    usage_metadata={"input_tokens": 14, "output_tokens": 4, "total_tokens": 18},
+                ),
+            ]
+        )
 
         prompt = PromptTemplate.from_template("{input}")
-        node = LLMNode(llm=mock_llm, prompt=prompt, output_model=TestOutput, max_retries=2)
+        node = LLMNode(llm=fake_llm, prompt=prompt, output_model=TestOutput, max_retries=2)
         node.step_name = "test_step"
 
-        state = PipelineState(
-            observation=Observation(
-                entity_id="test",
-                current_simulation_time=0,
-                status=StatusObservation(position=(0, 0), movement_locked=False),
-            )
-        )
-
         await node.call_llm(state, input="test")
 
         # Should sum all attempts: 11 + 14 + 18 = 43
         assert state.tokens_used["test_step"] == 43
 
     @pytest.mark.asyncio
-    async def test_retry_tracks_tokens_even_on_failure(self):
+    async def test_retry_tracks_tokens_even_on_failure(self, state):
         """Should track tokens even when all retries fail"""
 
         class TestOutput(BaseModel):
             value: str
 
-        mock_llm = AsyncMock()
-        mock_llm.ainvoke.side_effect = [
-            AIMessage(
-                content="bad1",
-                usage_metadata={"input_tokens": 10, "output_tokens": 1, "total_tokens": 11},
-            ),
-            AIMessage(
-                content="bad2",
-                usage_metadata={"input_tokens": 11, "output_tokens": 1, "total_tokens": 12},
-            ),
-        ]
+        fake_llm = FakeLLM(
+            [
+                AIMessage(
+                    content="bad1",
+                    usage_metadata={"input_tokens": 10, "output_tokens": 1, "total_tokens": 11},
+                ),
+                AIMessage(
+                    content="bad2",
+                    usage_metadata={"input_tokens": 11, "output_tokens": 1, "total_tokens": 12},
+                ),
+            ]
+        )
 
         prompt = PromptTemplate.from_template("{input}")
-        node = LLMNode(llm=mock_llm, prompt=prompt, output_model=TestOutput, max_retries=1)
+        node = LLMNode(llm=fake_llm, prompt=prompt, output_model=TestOutput, max_retries=1)
         node.step_name = "test_step"
 
-        state = PipelineState(
-            observation=Observation(
-                entity_id="test",
-                current_simulation_time=0,
-                status=StatusObservation(position=(0, 0), movement_locked=False),
-            )
-        )
-
         with pytest.raises((json.JSONDecodeError, ValidationError)):
             await node.call_llm(state, input="test")
 
@@ -414,15 +461,22 @@ class TestTokenExtraction:
         assert tokens == 8
 
     def test_extract_tokens_without_usage_metadata(self):
-        """Should return 0 when no usage_metadata"""
+        """Should estimate prompt and response tokens when no usage_metadata"""
         mock_llm = AsyncMock()
         prompt = PromptTemplate.from_template("{input}")
         node = LLMNode(llm=mock_llm, prompt=prompt)
 
         response = AIMessage(content="test")
+        messages = [HumanMessage(content="x" * 40)]
 
-        tokens = node._extract_tokens(response)
-        assert tokens == 0
+        assert node._extract_tokens(response) == 1
+        assert node._extract_tokens(response, messages) == 11
+
+    def test_extract_tokens_empty_response_without_usage_metadata(self):
+        """Should return 0 for an empty response with no prompt"""
+        node = LLMNode(llm=AsyncMock(), prompt=PromptTemplate.from_template("{input}"))
+
+        assert node._extract_tokens(AIMessage(content="")) == 0
 
     def test_extract_tokens_with_missing_total_tokens(self):
         """Should return 0 when total_tokens is missing from usage_metadata"""
@@ -442,40 +496,39 @@ class TestTokenExtraction:
 class TestEntityTagAttribution:
     """NPC-789: log records must carry the entity id for Events-tab attribution"""
 
-    def _make_state(self, entity_id="entity_attribution_test"):
-        return PipelineState(
-            observation=Observation(
-                entity_id=entity_id,
-                current_simulation_time=0,
-                status=StatusObservation(position=(0, 0), movement_locked=False),
-            )
-        )
+    @pytest.fixture
+    def state(self, state):
+        """Module state with a distinctive entity id to look for in log records"""
+        state.observation.entity_id = "entity_attribution_test"
+        return state
 
-    def test_entity_tag_brackets_entity_id(self):
+    def test_entity_tag_brackets_entity_id(self, state):
         """Should wrap the entity id in brackets, matching per-entity log convention"""
-        state = self._make_state("npc_alice")
+        state.observation.entity_id = "npc_alice"
         assert entity_tag(state) == "[npc_alice]"
 
-    def test_entity_tag_falls_back_when_entity_id_empty(self):
+    def test_entity_tag_falls_back_when_entity_id_empty(self, state):
         """Should produce a recognizable fallback instead of an empty tag"""
-        state = self._make_state("")
+        state.observation.entity_id = ""
         assert entity_tag(state) == "[unknown]"
 
     @pytest.mark.asyncio
-    async def test_raw_string_log_records_carry_entity_id(self, caplog):
+    async def test_raw_string_log_records_carry_entity_id(self, state, caplog):
         """call_llm raw-string path must emit only attributed records"""
-        mock_llm = AsyncMock()
-        mock_llm.ainvoke.return_value = AIMessage(
-            content="Response",
-            usage_metadata={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2},
+        fake_llm = FakeLLM(
+            [
+                AIMessage(
+                    content="Response",
+                    usage_metadata={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2},
+                )
+            ]
         )
         node = LLMNode(
-            llm=mock_llm,
+            llm=fake_llm,
             prompt=PromptTemplate.from_template("{input}"),
             output_model=None,
         )
         node.step_name = "raw_step"
-        state = self._make_state()
 
         with caplog.at_level(logging.DEBUG, logger="mind"):
             await node.call_llm(state, input="hi")
@@ -487,31 +540,31 @@ class TestEntityTagAttribution:
             )
 
     @pytest.mark.asyncio
-    async def test_retry_log_records_carry_entity_id(self, caplog):
+    async def test_retry_log_records_carry_entity_id(self, state, caplog):
         """call_llm retry path must emit only attributed records"""
 
         class TestOutput(BaseModel):
             value: str
 
-        mock_llm = AsyncMock()
-        mock_llm.ainvoke.side_effect = [
-            AIMessage(
-                content="not valid json",
-                usage_metadata={"input_tokens": 10, "output_tokens": 3, "total_tokens": 13},
-            ),
-            AIMessage(
-                content='{"value": "success"}',
-                usage_metadata={"input_tokens": 12, "output_tokens": 4, "total_tokens": 16},
-            ),
-        ]
+        fake_llm = FakeLLM(
+            [
+                AIMessage(
+                    content="not valid json",
+                    usage_metadata={"input_tokens": 10, "output_tokens": 3, "total_tokens": 13},
+                ),
+                AIMessage(
+                    content='{"value": "success"}',
+                    usage_metadata={"input_tokens": 12, "output_tokens": 4, "total_tokens": 16},
+                ),
+            ]
+        )
         node = LLMNode(
-            llm=mock_llm,
+            llm=fake_llm,
             prompt=PromptTemplate.from_template("{input}"),
             output_model=TestOutput,
             max_retries=1,
         )
         node.step_name = "retry_step"
-        state = self._make_state()
 
         with caplog.at_level(logging.DEBUG, logger="mind"):
             result = await node.call_llm(state, input="hi")
@@ -522,3 +575,194 @@ class TestEntityTagAttribution:
             assert "entity_attribution_test" in record.getMessage(), (
                 f"Unattributed log record: {record.getMessage()!r}"
             )
+
+
+class TestLLMNodeResponseCache:
+    """Test optional response caching in LLMNode.call_llm"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_skips_llm(self, state, make_node):
+        """Should serve an identical prompt from the cache without tokens"""
+        fake_llm = FakeLLM(
+            [
+                AIMessage(
+                    content='{"value": "cached"}',
+                    usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+                )
+            ]
+        )
+        node = make_node(fake_llm, response_cache=InMemoryResponseCache())
+        node.step_name = "test_step"
+
+        await node.call_llm(state.model_copy(deep=True), input="same")
+        result = await node.call_llm(state, input="same")
+
+        assert result.value == "cached"
+        assert fake_llm.call_count == 1
+        assert "test_step" not in state.tokens_used
+
+    @pytest.mark.asyncio
+    async def test_different_prompt_misses(self, state, make_node):
+        """Should call the LLM for a prompt it has not seen"""
+        fake_llm = FakeLLM([AIMessage(content='{"value": "x"}')])
+        node = make_node(fake_llm, response_cache=InMemoryResponseCache())
+
+        await node.call_llm(state, input="first")
+        await node.call_llm(state, input="second")
+
+        assert fake_llm.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_raw_string_output_cached(self, state, make_node):
+        """Should cache raw string responses too"""
+        fake_llm = FakeLLM([AIMessage(content="raw response")])
+        node = make_node(fake_llm, output_model=None, response_cache=InMemoryResponseCache())
+
+        await node.call_llm(state, input="same")
+        result = await node.call_llm(state, input="same")
+
+        assert result == "raw response"
+        assert fake_llm.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_output_failing_validation_is_a_miss(self, state, make_node):
+        """Should fall back to the LLM when a cached response no longer validates"""
+        fake_llm = FakeLLM([AIMessage(content='{"value": "fresh"}')])
+        node = make_node(fake_llm, response_cache=InMemoryResponseCache())
+        await node.response_cache.set(node.cache_namespace, "same", '{"value": 1}')
+
+        result = await node.call_llm(state, input="same")
+
+        assert result.value == "fresh"
+        assert fake_llm.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_output_schema_change_misses(self, state, make_node):
+        """Should not share entries between nodes whose output schemas differ"""
+
+        class _OtherOutput(BaseModel):
+            value: str
+            extra: int = 0
+
+        cache = InMemoryResponseCache()
+        fake_llm = FakeLLM([AIMessage(content='{"value": "x"}')])
+        old = make_node(fake_llm, response_cache=cache)
+        new = make_node(fake_llm, output_model=_OtherOutput, response_cache=cache)
+
+        await old.call_llm(state, input="same")
+        await new.call_llm(state, input="same")
+
+        assert old.cache_namespace != new.cache_namespace
+        assert fake_llm.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_in_memory_cache_evicts_least_recently_used(self):
+        """Should keep at most max_entries, evicting the least recently used"""
+        cache = InMemoryResponseCache(max_entries=2)
+        await cache.set("step", "a", "1")
+        await cache.set("step", "b", "2")
+        await cache.get("step", "a")
+        await cache.set("step", "c", "3")
+
+        assert len(cache) == 2
+        assert await cache.get("step", "a") == "1"
+        assert await cache.get("step", "b") is None
+
+
+class TestLLMNodeStructuredOutputMode:
+    """Test provider-native structured output (with_structured_output)"""
+
+    @staticmethod
+    def _mock_llms(structured_result):
+        """Chat model mock plus the runnable its with_structured_output returns"""
+        mock_llm = AsyncMock()
+        structured_llm = AsyncMock()
+        structured_llm.ainvoke.return_value = structured_result
+        mock_llm.with_structured_output = MagicMock(return_value=structured_llm)
+        return mock_llm, structured_llm
+
+    @pytest.mark.asyncio
+    async def test_uses_provider_parsed_output(self, state, make_node):
+        """Should validate the provider-parsed dict and track raw message tokens"""
+        raw = AIMessage(
+            content='{"value": "parsed"}',
+            usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        )
+        mock_llm, structured_llm = self._mock_llms(
+            {"raw": raw, "parsed": {"value": "parsed"}, "parsing_error": None}
+        )
+        node = make_node(mock_llm, structured_output=True)
+        node.step_name = "test_step"
+
+        result = await node.call_llm(state, input="test")
+
+        assert result.value == "parsed"
+        assert state.tokens_used["test_step"] == 15
+        mock_llm.with_structured_output.assert_called_once_with(
+            ValueOutput.model_json_schema(), method="json_schema", include_raw=True
+        )
+        mock_llm.ainvoke.assert_not_called()
+        assert structured_llm.ainvoke.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_raw_content_on_parsing_error(self, state, make_node):
+        """Should parse the raw content when the provider could not"""
+        raw = AIMessage(content='```json\n{"value": "repaired"}\n```')
+        mock_llm, _ = self._mock_llms(
+            {"raw": raw, "parsed": None, "parsing_error": ValueError("bad json")}
+        )
+        node = make_node(mock_llm, structured_output=True)
+
+        result = await node.call_llm(state, input="test")
+
+        assert result.value == "repaired"
+
+    def test_disabled_by_default(self, make_node):
+        """Should not wrap the LLM unless structured_output is requested"""
+        mock_llm = AsyncMock()
+        mock_llm.with_structured_output = MagicMock()
+
+        make_node(mock_llm)
+
+        mock_llm.with_structured_output.assert_not_called()
+
+
+class TestLLMNodeConcurrencyLimit:
+    """Test the optional shared cap on in-flight LLM requests"""
+
+    @pytest.mark.asyncio
+    async def test_shared_semaphore_caps_in_flight_calls(self, state_prototype):
+        """Should never exceed the limit across nodes sharing a semaphore"""
+        in_flight = 0
+        peak = 0
+
+        async def slow_invoke(messages):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return AIMessage(content="ok")
+
+        limit = asyncio.Semaphore(2)
+        nodes = []
+        for _ in range(3):
+            mock_llm = AsyncMock()
+            mock_llm.ainvoke.side_effect = slow_invoke
+            nodes.append(
+                LLMNode(
+                    llm=mock_llm,
+                    prompt=PromptTemplate.from_template("{input}"),
+                    concurrency_limit=limit,
+                )
+            )
+
+        results = await asyncio.gather(
+            *(
+                node.call_llm(state_prototype.model_copy(deep=True), input=str(i))
+                for i, node in enumerate(nodes * 2)
+            )
+        )
+
+        assert results == ["ok"] * 6
+        assert peak == 2
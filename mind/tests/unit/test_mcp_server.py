@@ -2,27 +2,74 @@
 
 import json
 import logging
+import os
 from unittest.mock import patch
 
 import pytest
-
+import pytest_asyncio
+from chromadb.api.client import SharedSystemClient
+from pydantic import ValidationError
+
+from mind.cognitive_architecture.actions import Action, ActionType
+from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
+from mind.cognitive_architecture.observations import MindEventType
+from mind.cognitive_architecture.state import PipelineState
 from mind.constants import DEFAULT_MEMORY_STORAGE_PATH
+from mind.interfaces.mcp.models import MindConfig
 from mind.interfaces.mcp.server import MCPServer
 
+# create_mind arguments for the mind most tests route decide_action to
+_CREATE_TEST_MIND = {
+    "mind_id": "mind_test",
+    "entity_id": "entity_test",
+    "config": {
+        "traits": [],
+        "initial_long_term_memories": [],
+    },
+}
+
+# Minimal valid observation for that mind
+_STATUS_OBSERVATION = {
+    "entity_id": "entity_test",
+    "current_simulation_time": 100,
+    "status": {
+        "position": [5, 5],
+        "movement_locked": False,
+        "current_interaction": {},
+        "controller_state": {},
+    },
+}
+
 
 def parse_response(result):
     """Parse MCP response from TextContent list"""
     return json.loads(result[0].text)
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestMCPServerErrorHandling:
-    """Test MCP server error handling - critical for production"""
+    """Test MCP server error handling - critical for production
 
-    @pytest.mark.asyncio
-    async def test_decide_action_with_missing_mind(self):
-        """Should return error dict when mind doesn't exist"""
+    Tests share one server and pre-created mind; the autouse fixture restores the
+    mind's pipeline and pending bids between tests.
+    """
+
+    @pytest_asyncio.fixture(scope="class", loop_scope="module")
+    async def server(self):
         server = MCPServer()
+        await server.mcp.call_tool("create_mind", _CREATE_TEST_MIND)
+        return server
+
+    @pytest.fixture(autouse=True)
+    def _reset_mind(self, server):
+        mind = server.minds["mind_test"]
+        original_process = mind.pipeline.process
+        yield
+        mind.pipeline.process = original_process
+        mind.pending_incoming_bids.clear()
 
+    async def test_decide_action_with_missing_mind(self, server):
+        """Should return error dict when mind doesn't exist"""
         result = await server.mcp.call_tool(
             "decide_action",
             {
@@ -42,23 +89,8 @@ class TestMCPServerErrorHandling:
         assert response["action"] is None
         assert "request_id" in response
 
-    @pytest.mark.asyncio
-    async def test_decide_action_with_invalid_observation_missing_required_field(self):
+    async def test_decide_action_with_invalid_observation_missing_required_field(self, server):
         """Should return error dict for missing required fields"""
-        server = MCPServer()
-
-        await server.mcp.call_tool(
-            "create_mind",
-            {
-                "mind_id": "mind_test",
-                "entity_id": "entity_test",
-                "config": {
-                    "traits": [],
-                    "initial_long_term_memories": [],
-                },
-            },
-        )
-
         result = await server.mcp.call_tool(
             "decide_action",
             {
@@ -79,23 +111,8 @@ class TestMCPServerErrorHandling:
             or "current_simulation_time" in response["error_message"]
         )
 
-    @pytest.mark.asyncio
-    async def test_decide_action_with_invalid_observation_wrong_type(self):
+    async def test_decide_action_with_invalid_observation_wrong_type(self, server):
         """Should return error dict for wrong field types"""
-        server = MCPServer()
-
-        await server.mcp.call_tool(
-            "create_mind",
-            {
-                "mind_id": "mind_test",
-                "entity_id": "entity_test",
-                "config": {
-                    "traits": [],
-                    "initial_long_term_memories": [],
-                },
-            },
-        )
-
         result = await server.mcp.call_tool(
             "decide_action",
             {
@@ -118,23 +135,8 @@ class TestMCPServerErrorHandling:
             or "int" in response["error_message"].lower()
         )
 
-    @pytest.mark.asyncio
-    async def test_decide_action_with_vision_empty_dict(self):
+    async def test_decide_action_with_vision_empty_dict(self, server):
         """Should return error dict for malformed vision observation"""
-        server = MCPServer()
-
-        await server.mcp.call_tool(
-            "create_mind",
-            {
-                "mind_id": "mind_test",
-                "entity_id": "entity_test",
-                "config": {
-                    "traits": [],
-                    "initial_long_term_memories": [],
-                },
-            },
-        )
-
         result = await server.mcp.call_tool(
             "decide_action",
             {
@@ -158,23 +160,8 @@ class TestMCPServerErrorHandling:
             or "ValidationError" in response["error_message"]
         )
 
-    @pytest.mark.asyncio
-    async def test_decide_action_error_includes_exception_type(self):
+    async def test_decide_action_error_includes_exception_type(self, server):
         """Should include exception type in error message for debugging"""
-        server = MCPServer()
-
-        await server.mcp.call_tool(
-            "create_mind",
-            {
-                "mind_id": "mind_test",
-                "entity_id": "entity_test",
-                "config": {
-                    "traits": [],
-                    "initial_long_term_memories": [],
-                },
-            },
-        )
-
         result = await server.mcp.call_tool(
             "decide_action",
             {
@@ -193,35 +180,10 @@ class TestMCPServerErrorHandling:
         assert ":" in response["error_message"]
         assert "request_id" in response
 
-    @pytest.mark.asyncio
-    async def test_decide_action_with_valid_observation(self):
+    async def test_decide_action_with_valid_observation(self, server):
         """Should return success with valid observation when pipeline succeeds"""
-        from mind.cognitive_architecture.actions import Action
-        from mind.cognitive_architecture.state import PipelineState
-
-        server = MCPServer()
-
-        await server.mcp.call_tool(
-            "create_mind",
-            {
-                "mind_id": "mind_test",
-                "entity_id": "entity_test",
-                "config": {
-                    "traits": ["curious"],
-                    "initial_long_term_memories": [],
-                },
-            },
-        )
-
         observation = {
-            "entity_id": "entity_test",
-            "current_simulation_time": 100,
-            "status": {
-                "position": [5, 5],
-                "movement_locked": False,
-                "current_interaction": {},
-                "controller_state": {},
-            },
+            **_STATUS_OBSERVATION,
             "needs": {
                 "needs": {"hunger": 75.0, "energy": 50.0},
                 "max_value": 100.0,
@@ -241,7 +203,6 @@ class TestMCPServerErrorHandling:
 
         # Mock the pipeline to return a successful action
         mind = server.minds["mind_test"]
-        original_process = mind.pipeline.process
 
         async def mock_process(state: PipelineState) -> PipelineState:
             state.chosen_action = Action.model_construct(action="wait", parameters={})
@@ -257,9 +218,6 @@ class TestMCPServerErrorHandling:
             },
         )
 
-        # Restore original
-        mind.pipeline.process = original_process
-
         response = parse_response(result)
 
         assert response is not None
@@ -273,44 +231,14 @@ class TestMCPServerErrorHandling:
             assert "action" in response["action"]
             assert "parameters" in response["action"]
 
-    @pytest.mark.asyncio
-    async def test_bid_cleanup_after_response(self, caplog):
+    async def test_bid_cleanup_after_response(self, server, caplog):
         """Should remove bid from pending_incoming_bids after responding.
 
         Also asserts the attribution decouple: the bid-cleanup log line carries the
         entity FK (entity_test), not the mind PK (mind_test), so the sim /logs
         forwarder routes it to the NPC's Events tab.
         """
-        import logging
-
-        from mind.cognitive_architecture.actions import Action, ActionType
-        from mind.cognitive_architecture.observations import MindEventType
-        from mind.cognitive_architecture.state import PipelineState
-
-        server = MCPServer()
-
-        await server.mcp.call_tool(
-            "create_mind",
-            {
-                "mind_id": "mind_test",
-                "entity_id": "entity_test",
-                "config": {
-                    "traits": ["friendly"],
-                    "initial_long_term_memories": [],
-                },
-            },
-        )
-
-        observation = {
-            "entity_id": "entity_test",
-            "current_simulation_time": 100,
-            "status": {
-                "position": [5, 5],
-                "movement_locked": False,
-                "current_interaction": {},
-                "controller_state": {},
-            },
-        }
+        observation = _STATUS_OBSERVATION
 
         # Create bid event
         bid_event = {
@@ -326,7 +254,6 @@ class TestMCPServerErrorHandling:
 
         # Mock the pipeline to return a bid response action
         mind = server.minds["mind_test"]
-        original_process = mind.pipeline.process
 
         async def mock_process(state: PipelineState) -> PipelineState:
             state.chosen_action = Action.model_construct(
@@ -352,9 +279,6 @@ class TestMCPServerErrorHandling:
                 },
             )
 
-        # Restore original
-        mind.pipeline.process = original_process
-
         response = parse_response(result)
 
         # Verify response is successful
@@ -374,37 +298,9 @@ class TestMCPServerErrorHandling:
             assert "[entity_test]" in line
             assert "[mind_test]" not in line
 
-    @pytest.mark.asyncio
-    async def test_bid_cleanup_only_for_bid_response_actions(self):
+    async def test_bid_cleanup_only_for_bid_response_actions(self, server):
         """Should not affect pending_incoming_bids for non-bid actions"""
-        from mind.cognitive_architecture.actions import Action, ActionType
-        from mind.cognitive_architecture.observations import MindEventType
-        from mind.cognitive_architecture.state import PipelineState
-
-        server = MCPServer()
-
-        await server.mcp.call_tool(
-            "create_mind",
-            {
-                "mind_id": "mind_test",
-                "entity_id": "entity_test",
-                "config": {
-                    "traits": ["friendly"],
-                    "initial_long_term_memories": [],
-                },
-            },
-        )
-
-        observation = {
-            "entity_id": "entity_test",
-            "current_simulation_time": 100,
-            "status": {
-                "position": [5, 5],
-                "movement_locked": False,
-                "current_interaction": {},
-                "controller_state": {},
-            },
-        }
+        observation = _STATUS_OBSERVATION
 
         # Create bid event
         bid_event = {
@@ -420,7 +316,6 @@ class TestMCPServerErrorHandling:
 
         # Mock the pipeline to return a non-bid action (e.g., wait)
         mind = server.minds["mind_test"]
-        original_process = mind.pipeline.process
 
         async def mock_process(state: PipelineState) -> PipelineState:
             state.chosen_action = Action.model_construct(
@@ -440,9 +335,6 @@ class TestMCPServerErrorHandling:
             },
         )
 
-        # Restore original
-        mind.pipeline.process = original_process
-
         response = parse_response(result)
 
         # Verify response is successful
@@ -457,10 +349,6 @@ class TestMindConfigValidation:
     """Pydantic range validation on MindConfig.personality_dimensions (NPC-672)"""
 
     def test_rejects_value_above_one(self):
-        from pydantic import ValidationError
-
-        from mind.interfaces.mcp.models import MindConfig
-
         with pytest.raises(ValidationError):
             MindConfig(
                 traits=["curious"],
@@ -468,10 +356,6 @@ class TestMindConfigValidation:
             )
 
     def test_rejects_negative_value(self):
-        from pydantic import ValidationError
-
-        from mind.interfaces.mcp.models import MindConfig
-
         with pytest.raises(ValidationError):
             MindConfig(
                 traits=["curious"],
@@ -479,8 +363,6 @@ class TestMindConfigValidation:
             )
 
     def test_accepts_in_range_values(self):
-        from mind.interfaces.mcp.models import MindConfig
-
         config = MindConfig(
             traits=["curious"],
             personality_dimensions={
@@ -495,15 +377,13 @@ class TestMindConfigValidation:
 
     def test_config_has_no_entity_id_field(self):
         """entity_id is a create_mind arg (FK), not config: config is pure cognition."""
-        from mind.interfaces.mcp.models import MindConfig
-
         assert "entity_id" not in MindConfig.model_fields
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestCreateMindDecouplesIds:
     """create_mind treats mind_id (PK) and entity_id (FK) as distinct first-class ids."""
 
-    @pytest.mark.asyncio
     async def test_distinct_ids_flow_independently(self):
         server = MCPServer()
 
@@ -532,6 +412,58 @@ class TestCreateMindDecouplesIds:
         assert mind.memory_store.collection.name == "mind_mind_abc"
 
 
+@pytest.mark.asyncio(loop_scope="module")
+class TestSharedLLMResources:
+    """Every hosted mind's LLM nodes share the server's response cache and LLM request cap."""
+
+    async def test_minds_share_llm_resources(self):
+        server = MCPServer()
+
+        for mind_id in ("mind_a", "mind_b"):
+            await server.mcp.call_tool(
+                "create_mind",
+                {"mind_id": mind_id, "entity_id": f"entity_{mind_id}", "config": {"traits": []}},
+            )
+
+        for mind in server.minds.values():
+            pipeline = mind.pipeline
+            for node in (
+                pipeline.memory_query_node,
+                pipeline.cognitive_update_node,
+                pipeline.action_selection_node,
+            ):
+                assert node.response_cache is server.response_cache
+                assert node.concurrency_limit is server.llm_concurrency
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestStructuredOutputOptIn:
+    """Provider-native structured output is off unless the mind's config opts in."""
+
+    async def test_llm_nodes_follow_mind_config(self):
+        server = MCPServer()
+        configs = {
+            "mind_plain": {"traits": []},
+            "mind_structured": {"traits": [], "llm_structured_output": True},
+        }
+
+        for mind_id, config in configs.items():
+            await server.mcp.call_tool(
+                "create_mind",
+                {"mind_id": mind_id, "entity_id": f"entity_{mind_id}", "config": config},
+            )
+
+        for mind_id, expected in (("mind_plain", False), ("mind_structured", True)):
+            pipeline = server.minds[mind_id].pipeline
+            for node in (
+                pipeline.memory_query_node,
+                pipeline.cognitive_update_node,
+                pipeline.action_selection_node,
+            ):
+                assert (node._structured_llm is not None) == expected
+
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestDecideActionEntityIdMismatch:
     """decide_action rejects (after logging both ids) when the observation entity_id
     (FK) diverges from the routed mind entity_id - misrouting is a boundary bug (NPC-795)."""
@@ -539,20 +471,7 @@ class TestDecideActionEntityIdMismatch:
     @staticmethod
     async def _run_decide(server, observation):
         """Create a mind (entity_test) with a stubbed pipeline, run decide_action."""
-        from mind.cognitive_architecture.actions import Action
-        from mind.cognitive_architecture.state import PipelineState
-
-        await server.mcp.call_tool(
-            "create_mind",
-            {
-                "mind_id": "mind_test",
-                "entity_id": "entity_test",
-                "config": {
-                    "traits": [],
-                    "initial_long_term_memories": [],
-                },
-            },
-        )
+        await server.mcp.call_tool("create_mind", _CREATE_TEST_MIND)
 
         mind = server.minds["mind_test"]
 
@@ -570,10 +489,7 @@ class TestDecideActionEntityIdMismatch:
             },
         )
 
-    @pytest.mark.asyncio
     async def test_rejects_when_observation_entity_id_differs_from_mind(self, caplog):
-        import logging
-
         server = MCPServer()
         observation = {
             "entity_id": "entity_other",
@@ -593,10 +509,7 @@ class TestDecideActionEntityIdMismatch:
         assert mismatch_lines, "expected an entity_id mismatch warning before the reject"
         assert any("entity_other" in line and "entity_test" in line for line in mismatch_lines)
 
-    @pytest.mark.asyncio
     async def test_silent_when_observation_entity_id_matches_mind(self, caplog):
-        import logging
-
         server = MCPServer()
         observation = {
             "entity_id": "entity_test",
@@ -631,8 +544,6 @@ class TestMindPersistenceLifecycle:
 
     @pytest.fixture(autouse=True)
     def _isolated_chroma(self, monkeypatch, tmp_path):
-        from chromadb.api.client import SharedSystemClient
-
         SharedSystemClient.clear_system_cache()
         monkeypatch.chdir(tmp_path)
         yield
@@ -646,7 +557,7 @@ class TestMindPersistenceLifecycle:
             {"mind_id": mind_id, "entity_id": entity_id, "config": config},
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_relink_resident_mind_rebinds_fk_in_place(self):
         """A still-resident mind keeps its collection and just gets a new entity FK."""
         server = MCPServer()
@@ -668,7 +579,7 @@ class TestMindPersistenceLifecycle:
         assert mind.entity_id == "entity_new"
         assert mind.memory_store.collection.count() == count_before
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_release_retains_collection_then_relink_rehydrates_with_new_fk(self):
         """cleanup_mind retains the collection; relink rehydrates it with a new FK
         and the memory count is unchanged."""
@@ -695,7 +606,7 @@ class TestMindPersistenceLifecycle:
         assert rehydrated.entity_id == "entity_new"
         assert rehydrated.memory_store.collection.count() == count_before
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_relink_does_not_reseed_initial_memories(self):
         """reattach skips the seed loop, so relinking does not double the seeds."""
         server = MCPServer()
@@ -712,11 +623,9 @@ class TestMindPersistenceLifecycle:
         # If reattach re-seeded, this would be 4. It must stay 2.
         assert server.minds["mind_c"].memory_store.collection.count() == seed_count
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_cleanup_retains_but_forget_deletes_collection(self):
         """collection_exists is True after release, False after forget."""
-        from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
-
         server = MCPServer()
         storage_path = DEFAULT_MEMORY_STORAGE_PATH
 
@@ -738,12 +647,10 @@ class TestMindPersistenceLifecycle:
         )
         assert relink["status"] == "not_found"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_forget_resident_mind_drops_instance_and_collection(self):
         """forget_mind on a resident mind drops it from the registry and deletes its
         collection (no recreated empty shell)."""
-        from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
-
         server = MCPServer()
         storage_path = DEFAULT_MEMORY_STORAGE_PATH
 
@@ -756,7 +663,7 @@ class TestMindPersistenceLifecycle:
         assert "mind_e" not in server.minds
         assert VectorDBMemory.collection_exists(storage_path, "mind_mind_e") is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_forget_resident_mind_tolerates_an_already_deleted_collection(self):
         """forget_mind still drops the registry entry when the collection is already gone.
 
@@ -791,7 +698,7 @@ class TestMindPersistenceLifecycle:
         )
         assert relink["status"] == "not_found"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_restart_reattach_recovers_memory_across_server_instances(self):
         """Simulate a server restart: create + memory on one instance, drop it, then a
         fresh MCPServer relinks the same mind_id and the memory survives.
@@ -824,10 +731,6 @@ class TestMindPersistenceLifecycle:
         """collection_exists must be a pure read: a never-persisted path returns False
         and is NOT created on disk as a side effect (PersistentClient otherwise mkdir's
         the path). Regression for the empty-DB-dir leak (PR #17 review)."""
-        import os
-
-        from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
-
         missing_path = os.path.join(os.getcwd(), "never_persisted_db")
         assert not os.path.exists(missing_path)
 
@@ -836,14 +739,12 @@ class TestMindPersistenceLifecycle:
         # The probe must not have created the directory.
         assert not os.path.exists(missing_path)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_forget_non_resident_deletes_collection_without_loading_encoder(self):
         """Forgetting a non-resident retained collection must delete it via a bare
         client - no SentenceTransformer load, no get_or_create that would recreate the
         collection before deleting it. Regression for the heavy-construct forget path
         (PR #17 review)."""
-        from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
-
         server = MCPServer()
         storage_path = DEFAULT_MEMORY_STORAGE_PATH
 
@@ -869,6 +770,7 @@ class TestMindPersistenceLifecycle:
         assert VectorDBMemory.collection_exists(storage_path, "mind_mind_g") is False
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestCustomStoragePathLifecycle:
     """relink_mind / forget_mind must address the path a mind was CREATED with,
     not the default one (NPC-1023).
@@ -888,8 +790,6 @@ class TestCustomStoragePathLifecycle:
 
     @pytest.fixture(autouse=True)
     def _isolated_chroma(self, monkeypatch, tmp_path):
-        from chromadb.api.client import SharedSystemClient
-
         SharedSystemClient.clear_system_cache()
         monkeypatch.chdir(tmp_path)
         yield
@@ -903,7 +803,6 @@ class TestCustomStoragePathLifecycle:
             {"mind_id": mind_id, "entity_id": entity_id, "config": config},
         )
 
-    @pytest.mark.asyncio
     async def test_relink_rehydrates_a_released_mind_on_a_custom_storage_path(self):
         """Release then relink must recover the mind, not report "not_found".
 
@@ -911,8 +810,6 @@ class TestCustomStoragePathLifecycle:
         keeps the collection so a later relink can re-attach. Probing the default
         path breaks that contract for every mind not on "./chroma_db".
         """
-        from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
-
         server = MCPServer()
         await self._create_mind(server, "mind_cp", "entity_cp")
         server.minds["mind_cp"].memory_store.add_memory(content="custom", importance=5.0)
@@ -936,7 +833,6 @@ class TestCustomStoragePathLifecycle:
         # Rehydrated against the retained collection, so the memory survives.
         assert server.minds["mind_cp"].memory_store.collection.count() == 1
 
-    @pytest.mark.asyncio
     async def test_forget_erases_a_released_mind_on_a_custom_storage_path(self):
         """forget_mind must actually delete the custom-path collection.
 
@@ -945,8 +841,6 @@ class TestCustomStoragePathLifecycle:
         the caller the mind was erased when it was not. A status that lies about a
         destructive operation is worse than an honest "not_found".
         """
-        from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
-
         server = MCPServer()
         await self._create_mind(server, "mind_cq", "entity_cq")
         server.minds["mind_cq"].memory_store.add_memory(content="erase me", importance=5.0)
@@ -962,7 +856,6 @@ class TestCustomStoragePathLifecycle:
         # the one operation that may drop the recorded config.
         assert "mind_cq" not in server.mind_configs
 
-    @pytest.mark.asyncio
     async def test_forget_reports_not_found_when_no_collection_was_erased(self):
         """An unknown mind_id must not be reported as "forgotten".
 
@@ -978,7 +871,6 @@ class TestCustomStoragePathLifecycle:
 
         assert forget["status"] == "not_found"
 
-    @pytest.mark.asyncio
     async def test_second_forget_of_the_same_mind_reports_not_found(self):
         """The repeat case a retrying client actually produces, as opposed to an id
         that never existed.
@@ -989,8 +881,6 @@ class TestCustomStoragePathLifecycle:
         second call is "not_found": nothing was erased, because there was nothing
         left to erase.
         """
-        from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
-
         server = MCPServer()
         await self._create_mind(server, "mind_cr", "entity_cr")
 
@@ -1002,6 +892,7 @@ class TestCustomStoragePathLifecycle:
         assert second["status"] == "not_found"
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestRestartStoragePathParameter:
     """A restarted server can address a custom-path mind when the client supplies the
     path (NPC-1023).
@@ -1020,8 +911,6 @@ class TestRestartStoragePathParameter:
 
     @pytest.fixture(autouse=True)
     def _isolated_chroma(self, monkeypatch, tmp_path):
-        from chromadb.api.client import SharedSystemClient
-
         SharedSystemClient.clear_system_cache()
         monkeypatch.chdir(tmp_path)
         yield
@@ -1035,7 +924,6 @@ class TestRestartStoragePathParameter:
             {"mind_id": mind_id, "entity_id": entity_id, "config": config},
         )
 
-    @pytest.mark.asyncio
     async def test_relink_after_restart_recovers_a_custom_path_mind_when_path_supplied(self):
         """The restart case: a fresh server has no record, so the client's path is the
         only thing that can locate the collection."""
@@ -1064,7 +952,6 @@ class TestRestartStoragePathParameter:
         assert relink["status"] == "relinked"
         assert server2.minds["mind_rs"].memory_store.collection.count() == count_before
 
-    @pytest.mark.asyncio
     async def test_relink_after_restart_still_not_found_without_the_path(self):
         """Omitting the parameter preserves the old behavior exactly.
 
@@ -1085,7 +972,6 @@ class TestRestartStoragePathParameter:
 
         assert relink["status"] == "not_found"
 
-    @pytest.mark.asyncio
     async def test_forget_after_restart_erases_a_custom_path_mind_when_path_supplied(self):
         """The worst half of NPC-1023, at restart scope.
 
@@ -1094,8 +980,6 @@ class TestRestartStoragePathParameter:
         their data is destroyed when it is not. A status-only test would pass against
         exactly that bug.
         """
-        from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
-
         server1 = MCPServer()
         await self._create_mind(server1, "mind_ru", "entity_ru")
         server1.minds["mind_ru"].memory_store.add_memory(content="erase me", importance=5.0)
@@ -1114,12 +998,9 @@ class TestRestartStoragePathParameter:
         assert forget["status"] == "forgotten"
         assert VectorDBMemory.collection_exists(self.CUSTOM_PATH, "mind_mind_ru") is False
 
-    @pytest.mark.asyncio
     async def test_forget_after_restart_reports_not_found_without_the_path(self):
         """Without the path the collection is not reachable, so nothing is erased -
         and the status must say so rather than claim a deletion it did not perform."""
-        from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
-
         server1 = MCPServer()
         await self._create_mind(server1, "mind_rv", "entity_rv")
         del server1
@@ -1131,7 +1012,6 @@ class TestRestartStoragePathParameter:
         # The collection is untouched, which is what makes "not_found" the honest answer.
         assert VectorDBMemory.collection_exists(self.CUSTOM_PATH, "mind_mind_rv") is True
 
-    @pytest.mark.asyncio
     async def test_supplied_path_is_ignored_when_a_config_is_recorded(self, caplog):
         """Precedence rule 1: the recorded config beats a caller-supplied path.
 
@@ -1145,8 +1025,6 @@ class TestRestartStoragePathParameter:
         success over a location the caller never named - so a silent discard is the
         failure this branch exists to prevent, not a cosmetic regression.
         """
-        from mind.cognitive_architecture.memory.vector_db_memory import VectorDBMemory
-
         wrong_path = "./tmp/wrong_path"
 
         server = MCPServer()
@@ -1178,7 +1056,6 @@ class TestRestartStoragePathParameter:
         assert wrong_path in caplog.text
         assert self.CUSTOM_PATH in caplog.text
 
-    @pytest.mark.asyncio
     async def test_an_equivalent_path_spelling_does_not_warn(self, caplog):
         """The warning must not fire on a caller who AGREES with the record.
 
@@ -1226,6 +1103,7 @@ class TestRestartStoragePathParameter:
         ] == []
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestRecordedConfigFidelity:
     """relink_mind must rebuild a mind from the config it was CREATED with, not a
     default-constructed one (NPC-1023).
@@ -1240,14 +1118,11 @@ class TestRecordedConfigFidelity:
 
     @pytest.fixture(autouse=True)
     def _isolated_chroma(self, monkeypatch, tmp_path):
-        from chromadb.api.client import SharedSystemClient
-
         SharedSystemClient.clear_system_cache()
         monkeypatch.chdir(tmp_path)
         yield
         SharedSystemClient.clear_system_cache()
 
-    @pytest.mark.asyncio
     async def test_relink_reattaches_with_the_recorded_embedding_model(self):
         """The encoder the rehydrated store builds must be the one that wrote the
         stored vectors.
@@ -1283,7 +1158,6 @@ class TestRecordedConfigFidelity:
         assert relink["status"] == "relinked"
         encoder_ctor.assert_called_once_with(custom_model)
 
-    @pytest.mark.asyncio
     async def test_relink_reattaches_with_the_recorded_llm_model(self):
         """llm_model is recorded for the same reason as the rest, and fails the same way.
 
@@ -1317,7 +1191,6 @@ class TestRecordedConfigFidelity:
         assert relink["status"] == "relinked"
         get_llm_mock.assert_called_once_with(custom_model)
 
-    @pytest.mark.asyncio
     async def test_relink_restores_traits_and_personality_from_the_recorded_config(self):
         """A rehydrated mind must be the same character it was before release.
 
@@ -1350,7 +1223,6 @@ class TestRecordedConfigFidelity:
         assert rehydrated.traits == ["gruff", "loyal"]
         assert rehydrated.personality_dimensions == {"extroversion": 0.9}
 
-    @pytest.mark.asyncio
     async def test_recorded_config_drops_the_seed_payload(self):
         """The map records how to rebuild a mind, not what it was seeded with.
 
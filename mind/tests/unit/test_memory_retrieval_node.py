@@ -11,6 +11,11 @@ from mind.cognitive_architecture.observations import Observation, StatusObservat
 from mind.cognitive_architecture.state import PipelineState
 
 
+def _each_query(memories):
+    """batch_search stand-in that returns the same memories for every query"""
+    return lambda queries: [list(memories) for _ in queries]
+
+
 @pytest.mark.asyncio
 class TestMemoryRetrievalNode:
     """Test MemoryRetrievalNode in isolation"""
@@ -19,7 +24,7 @@ class TestMemoryRetrievalNode:
     def mock_memory_store(self):
         """Create a mock memory store"""
         mock = AsyncMock()
-        mock.search.return_value = []  # Default empty return
+        mock.batch_search.side_effect = _each_query([])  # Default empty return
         return mock
 
     @pytest.fixture
@@ -42,16 +47,19 @@ class TestMemoryRetrievalNode:
     async def test_retrieves_memories_for_queries(self, node, mock_memory_store, basic_state):
         """Should fetch memories for each query"""
         # Setup mock to return memories
-        mock_memory_store.search.return_value = [
-            Memory(id="mem_1", content="Yesterday I worked on a sword", importance=7.0),
-            Memory(id="mem_2", content="Customer ordered ceremonial blade", importance=8.0),
-        ]
+        mock_memory_store.batch_search.side_effect = _each_query(
+            [
+                Memory(id="mem_1", content="Yesterday I worked on a sword", importance=7.0),
+                Memory(id="mem_2", content="Customer ordered ceremonial blade", importance=8.0),
+            ]
+        )
 
         # Execute
         result = await node.process(basic_state)
 
-        # Verify search was called for each query
-        assert mock_memory_store.search.call_count == 2
+        # Verify all queries were sent in a single batch
+        assert mock_memory_store.batch_search.call_count == 1
+        assert len(mock_memory_store.batch_search.call_args.args[0]) == 2
 
         # Verify memories were added to state
         assert len(result.retrieved_memories) > 0
@@ -63,7 +71,8 @@ class TestMemoryRetrievalNode:
         memory_2 = Memory(id="mem_2", content="Blade order", importance=8.0)
 
         # Both queries return same memory_1 plus unique memories
-        mock_memory_store.search.side_effect = [
+        mock_memory_store.batch_search.side_effect = None
+        mock_memory_store.batch_search.return_value = [
             [memory_1, memory_2],  # First query
             [memory_1, Memory(id="mem_3", content="Forge hot", importance=5.0)],  # Second query
         ]
@@ -73,8 +82,7 @@ class TestMemoryRetrievalNode:
 
         # Should have 3 unique memories (mem_1 only once)
         memory_ids = [m.id for m in result.retrieved_memories]
-        assert len(memory_ids) == 3
-        assert len(set(memory_ids)) == 3  # All unique
+        assert memory_ids == ["mem_1", "mem_2", "mem_3"]  # All unique, in query order
 
     async def test_handles_empty_queries(self, node, mock_memory_store):
         """Should handle state with no memory queries"""
@@ -91,7 +99,7 @@ class TestMemoryRetrievalNode:
         result = await node.process(state)
 
         # Should not call search
-        mock_memory_store.search.assert_not_called()
+        mock_memory_store.batch_search.assert_not_called()
 
         # Should have empty memories list
         assert result.retrieved_memories == []
@@ -99,7 +107,7 @@ class TestMemoryRetrievalNode:
     async def test_handles_no_results(self, node, mock_memory_store, basic_state):
         """Should handle memory store returning no results"""
         # Setup mock to return empty list
-        mock_memory_store.search.return_value = []
+        mock_memory_store.batch_search.side_effect = _each_query([])
 
         # Execute
         result = await node.process(basic_state)
@@ -109,7 +117,7 @@ class TestMemoryRetrievalNode:
 
     async def test_tracks_timing(self, node, mock_memory_store, basic_state):
         """Should track execution time in state"""
-        mock_memory_store.search.return_value = []
+        mock_memory_store.batch_search.side_effect = _each_query([])
 
         # Execute
         result = await node.process(basic_state)
@@ -130,7 +138,7 @@ class TestMemoryRetrievalNode:
             personality_traits=["brave", "honest"],
         )
 
-        mock_memory_store.search.return_value = []
+        mock_memory_store.batch_search.side_effect = _each_query([])
 
         # Execute
         result = await node.process(state)
@@ -144,9 +152,11 @@ class TestMemoryRetrievalNode:
     ):
         """Every record from process() must carry the entity id so the simulation's
         log forwarder can attribute it to the NPC's Events tab (NPC-789)"""
-        mock_memory_store.search.return_value = [
-            Memory(id="mem_1", content="Yesterday I worked on a sword", importance=7.0),
-        ]
+        mock_memory_store.batch_search.side_effect = _each_query(
+            [
+                Memory(id="mem_1", content="Yesterday I worked on a sword", importance=7.0),
+            ]
+        )
 
         with caplog.at_level(logging.DEBUG, logger="mind"):
             await node.process(basic_state)
@@ -165,6 +165,26 @@ class TestVectorDBMemory:
         assert memory.embedding is not None
         assert len(memory.embedding) > 0
 
+    async def test_add_memories_batch(self, memory_store):
+        """Should store a batch of memories with per-memory metadata"""
+        memories = memory_store.add_memories(
+            [
+                {"content": "Forged a blade", "importance": 8.0, "location": (1, 2)},
+                {"content": "Sold a horseshoe", "timestamp": 50},
+            ]
+        )
+
+        assert [m.content for m in memories] == ["Forged a blade", "Sold a horseshoe"]
+        assert memories[0].location == (1, 2)
+        assert memories[1].importance == 1.0
+        assert len({m.id for m in memories}) == 2
+        assert memory_store.collection.count() == 2
+
+    async def test_add_memories_empty_batch(self, memory_store):
+        """Should accept an empty batch without touching the collection"""
+        assert memory_store.add_memories([]) == []
+        assert memory_store.collection.count() == 0
+
     async def test_memory_ids_are_stable(self, memory_store):
         """Should preserve memory IDs across retrievals"""
         # Add a memory
@@ -203,6 +223,47 @@ class TestVectorDBMemory:
         assert len(results) >= 1
         assert all("social" in m.tags for m in results)
 
+    async def test_batch_search_matches_individual_searches(self, memory_store):
+        """Should return the same per-query results as separate searches, in query order"""
+        memory_store.add_memory(content="Social interaction at market", tags=["social"])
+        memory_store.add_memory(content="Architecture of the castle", tags=["architecture"])
+        memory_store.add_memory(content="Routine patrol route", tags=["routine"])
+
+        queries = [
+            VectorDBQuery(query="market", top_k=2),
+            VectorDBQuery(query="activity", top_k=10, tags=["social"]),
+            VectorDBQuery(query="castle", top_k=2),
+        ]
+        batched = await memory_store.batch_search(queries)
+        individual = [await memory_store.search(q) for q in queries]
+
+        assert [[m.id for m in r] for r in batched] == [[m.id for m in r] for r in individual]
+
+    async def test_repeated_queries_reuse_cached_embedding(self, memory_store, monkeypatch):
+        """Should embed each distinct query text once across searches"""
+        memory_store.add_memory(content="Forged a sword")
+        encoded = []
+        encode = memory_store.encoder.encode
+
+        def counting_encode(sentences, **kwargs):
+            encoded.append(list(sentences))
+            return encode(sentences, **kwargs)
+
+        monkeypatch.setattr(memory_store.encoder, "encode", counting_encode)
+
+        first = await memory_store.search(VectorDBQuery(query="sword", top_k=1))
+        second = await memory_store.batch_search(
+            [VectorDBQuery(query="sword", top_k=1), VectorDBQuery(query="forge", top_k=1)]
+        )
+
+        assert encoded == [["sword"], ["forge"]]
+        assert second[0][0].id == first[0].id
+
+    async def test_batch_search_empty(self, memory_store):
+        """Should return one empty list per query against an empty store"""
+        assert await memory_store.batch_search([]) == []
+        assert await memory_store.batch_search([VectorDBQuery(query="anything")]) == [[]]
+
     async def test_search_without_tags_returns_all(self, memory_store):
         """No tag filter = all results returned"""
         memory_store.add_memory(content="Tagged memory", tags=["test"])